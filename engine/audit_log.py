@@ -95,28 +95,17 @@ class ImmutableAuditLog:
             return 1
         return self._entries[-1].sequence_number + 1
     
-    def append(
+    def _make_entry(
         self,
         action: str,
         actor: str,
         packet_id: str,
-        metadata: Optional[Dict] = None
+        metadata: Optional[Dict],
+        previous_hash: Optional[str],
+        sequence_number: int
     ) -> AuditLogEntry:
-        """
-        Append a new entry to the audit log.
-        
-        Args:
-            action: Action type ('create', 'approve', 'authorize', etc.)
-            actor: Operator ID or system identifier
-            packet_id: ID of the handshake packet
-            metadata: Additional context (signatures, evidence, etc.)
-        
-        Returns:
-            Created audit log entry
-        """
+        """Build a chained entry following previous_hash (does not store it)."""
         timestamp = datetime.now().isoformat()
-        previous_hash = self._get_previous_hash()
-        sequence_number = self._get_next_sequence()
         
         # Create entry data (without hashes)
         entry_data = {
@@ -140,8 +129,7 @@ class ImmutableAuditLog:
             combined = entry_hash
         receipt_hash = self._compute_hash(combined)
         
-        # Create entry
-        entry = AuditLogEntry(
+        return AuditLogEntry(
             timestamp=timestamp,
             action=action,
             actor=actor,
@@ -152,15 +140,66 @@ class ImmutableAuditLog:
             metadata=metadata or {},
             sequence_number=sequence_number
         )
+    
+    def append(
+        self,
+        action: str,
+        actor: str,
+        packet_id: str,
+        metadata: Optional[Dict] = None
+    ) -> AuditLogEntry:
+        """
+        Append a new entry to the audit log.
+        
+        Args:
+            action: Action type ('create', 'approve', 'authorize', etc.)
+            actor: Operator ID or system identifier
+            packet_id: ID of the handshake packet
+            metadata: Additional context (signatures, evidence, etc.)
+        
+        Returns:
+            Created audit log entry
+        """
+        return self.append_batch([{
+            'action': action,
+            'actor': actor,
+            'packet_id': packet_id,
+            'metadata': metadata
+        }])[0]
+    
+    def append_batch(self, records: List[Dict]) -> List[AuditLogEntry]:
+        """
+        Append several entries, chained in order, with a single file write.
+        
+        Args:
+            records: Dicts with 'action', 'actor', 'packet_id' and optional 'metadata'
+        
+        Returns:
+            Created audit log entries
+        """
+        previous_hash = self._get_previous_hash()
+        sequence_number = self._get_next_sequence()
+        entries: List[AuditLogEntry] = []
+        for record in records:
+            entry = self._make_entry(
+                record['action'], record['actor'], record['packet_id'],
+                record.get('metadata'), previous_hash, sequence_number
+            )
+            entries.append(entry)
+            previous_hash = entry.receipt_hash
+            sequence_number += 1
+        
+        if not entries:
+            return entries
         
         # Append to file (append-only)
         with open(self.log_path, 'a') as f:
-            f.write(entry.to_jsonl() + '\n')
+            f.write(''.join(entry.to_jsonl() + '\n' for entry in entries))
         
         # Add to in-memory list
-        self._entries.append(entry)
+        self._entries.extend(entries)
         
-        return entry
+        return entries
     
     def verify_chain(self) -> Dict:
         """
@@ -5,6 +5,7 @@ Fetches river level and rainfall telemetry from EA open data services.
 API Reference: https://environment.data.gov.uk/flood-monitoring/doc/reference
 """
 import requests
+from requests.adapters import HTTPAdapter
 import pandas as pd
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
@@ -21,6 +22,8 @@ class EAFloodClient:
     """Client for Environment Agency flood monitoring API."""
     
     BASE_URL = "https://environment.data.gov.uk/flood-monitoring"
+    # Keep-alive connections kept per host (enough for concurrent station polling)
+    POOL_MAXSIZE = 16
     
     def __init__(self, cache_dir: Optional[Path] = None):
         """
@@ -32,6 +35,10 @@ class EAFloodClient:
         self.cache_dir = cache_dir
         if cache_dir:
             cache_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Shared session: reuses TLS connections across requests and threads
+        self.session = requests.Session()
+        self.session.mount('https://', HTTPAdapter(pool_maxsize=self.POOL_MAXSIZE))
     
     def get_station_info(self, station_id: str) -> Dict:
         """
@@ -44,7 +51,7 @@ class EAFloodClient:
             Station metadata dictionary
         """
         url = f"{self.BASE_URL}/id/stations/{station_id}.json"
-        response = requests.get(url)
+        response = self.session.get(url)
         response.raise_for_status()
         return response.json()['items']
     
@@ -59,7 +66,7 @@ class EAFloodClient:
             List of measure dictionaries
         """
         url = f"{self.BASE_URL}/id/stations/{station_id}/measures.json"
-        response = requests.get(url)
+        response = self.session.get(url)
         response.raise_for_status()
         return response.json()['items']
     
@@ -112,7 +119,7 @@ class EAFloodClient:
         if area_name:
             params['label'] = area_name
         
-        response = requests.get(url, params=params)
+        response = self.session.get(url, params=params)
         response.raise_for_status()
         return response.json()['items']
     
@@ -151,7 +158,7 @@ class EAFloodClient:
                 with open(cache_key, 'r') as f:
                     return json.load(f)
         
-        response = requests.get(url, params=params)
+        response = self.session.get(url, params=params)
         response.raise_for_status()
         data = response.json()
         
@@ -245,7 +252,7 @@ class EAFloodClient:
         if label:
             params['label'] = label
         
-        response = requests.get(url, params=params)
+        response = self.session.get(url, params=params)
         response.raise_for_status()
         return response.json()['items']
 
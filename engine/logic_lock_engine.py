@@ -4,12 +4,34 @@ YAML-Driven Logic-Lock Rules Engine
 Validates commands against physics constraints defined in YAML configuration.
 """
 import yaml
+from collections import defaultdict, deque
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Deque, Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from enum import Enum
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# Parsed rule files keyed by resolved path -> (mtime_ns, config)
+_RULES_CACHE: Dict[str, Tuple[int, Dict]] = {}
+
+
+def _load_rules_config(rules_path: Path) -> Dict:
+    """Parse a rules YAML file, reusing the cached parse while its mtime is unchanged."""
+    resolved = str(Path(rules_path).resolve())
+    mtime_ns = Path(resolved).stat().st_mtime_ns
+    cached = _RULES_CACHE.get(resolved)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    with open(resolved, 'r') as f:
+        config = yaml.load(f, Loader=_YamlLoader) or {}
+    _RULES_CACHE[resolved] = (mtime_ns, config)
+    return config
+
 
 class ConstraintType(str, Enum):
     """Types of constraints."""
@@ -26,7 +48,12 @@ class Severity(str, Enum):
     CRITICAL = "critical"
 
 
-@dataclass
+# Direct value -> member lookups used when loading rules (avoids Enum(value) call overhead)
+_CONSTRAINT_TYPES: Dict[str, ConstraintType] = {m.value: m for m in ConstraintType}
+_SEVERITIES: Dict[str, Severity] = {m.value: m for m in Severity}
+
+
+@dataclass(slots=True)
 class LogicLockRule:
     """A Logic-Lock rule."""
     id: str
@@ -40,7 +67,7 @@ class LogicLockRule:
     temporal_window_seconds: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Command:
     """Command to validate."""
     asset_id: str
@@ -53,7 +80,7 @@ class Command:
     previous_timestamp: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Result of command validation."""
     valid: bool
@@ -67,11 +94,17 @@ class ValidationResult:
 class LogicLockEngine:
     """YAML-driven Logic-Lock rules engine."""
     
+    # Ramp-rate rules only compare against the immediately previous command
+    HISTORY_MAXLEN = 2
+    
     def __init__(self, rules_path: Optional[Path] = None):
         self.rules: Dict[str, LogicLockRule] = {}
         self.rule_sets: Dict[str, List[str]] = {}
         self.active_rule_set: str = "default"
-        self.command_history: Dict[str, List[Command]] = {}  # asset_id -> commands
+        # asset_id -> most recent commands (bounded)
+        self.command_history: Dict[str, Deque[Command]] = defaultdict(
+            lambda: deque(maxlen=self.HISTORY_MAXLEN)
+        )
         
         if rules_path:
             self.load_rules(rules_path)
@@ -83,8 +116,7 @@ class LogicLockEngine:
     
     def load_rules(self, rules_path: Path):
         """Load rules from YAML file."""
-        with open(rules_path, 'r') as f:
-            config = yaml.safe_load(f)
+        config = _load_rules_config(rules_path)
         
         # Load rules
         for rule_data in config.get('rules', []):
@@ -92,11 +124,11 @@ class LogicLockEngine:
                 id=rule_data['id'],
                 asset_type=rule_data['asset_type'],
                 parameter=rule_data['parameter'],
-                constraint_type=ConstraintType(rule_data['constraint_type']),
+                constraint_type=_CONSTRAINT_TYPES[rule_data['constraint_type']],
                 value=rule_data['value'],
                 unit=rule_data['unit'],
                 violation_message=rule_data['violation_message'],
-                severity=Severity(rule_data['severity']),
+                severity=_SEVERITIES[rule_data['severity']],
                 temporal_window_seconds=rule_data.get('temporal_window_seconds')
             )
             self.rules[rule.id] = rule
@@ -160,8 +192,6 @@ class LogicLockEngine:
         valid = len(critical_violations) == 0
         
         # Record command in history (for temporal constraints)
-        if command.asset_id not in self.command_history:
-            self.command_history[command.asset_id] = []
         self.command_history[command.asset_id].append(command)
         
         return ValidationResult(
@@ -15,11 +15,17 @@ before the grid flickers.
 """
 
 import json
-from typing import Dict, List, Optional, Tuple, Any
+import multiprocessing
+from collections import Counter, deque
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Deque, Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass, asdict
 from enum import Enum
 from datetime import datetime
 import hashlib
+import time
 
 from engine.logger import get_logger
 
@@ -40,6 +46,14 @@ class ConsensusResult(Enum):
     BLOCKED = "blocked"  # System blocked due to disagreement
 
 
+# Hash of each version's code/configuration, computed once at import so it is
+# reproducible across engines and runs (in production this would hash the actual code)
+_VERSION_HASHES: Dict[VersionID, str] = {
+    v: hashlib.sha256(f"MUNIN-{v.value}-v1.0".encode()).hexdigest()[:16]
+    for v in VersionID
+}
+
+
 @dataclass
 class VersionOutput:
     """Output from a single version of the inference engine."""
@@ -71,32 +85,111 @@ class NVersionProgrammingEngine:
     
     Runs multiple versions of the inference engine in parallel and requires
     M-of-N consensus before executing any command.
+    
+    With n_jobs > 1 the engine owns a worker pool: call close() when done, or use
+    the engine as a context manager.
     """
     
-    def __init__(self, n_versions: int = 3, threshold: int = 2):
+    def __init__(
+        self,
+        n_versions: int = 3,
+        threshold: int = 2,
+        n_jobs: int = 1,
+        history_cap: int = 10_000,
+        history_log_path: Optional[Path] = None
+    ):
         """
         Initialize N-version programming engine.
         
         Args:
             n_versions: Number of versions to run (default 3)
             threshold: Minimum number of versions that must agree (default 2, i.e., 2-of-3)
+            n_jobs: Worker processes for running versions concurrently (1=sequential).
+                Separate processes isolate a crashing version from the voter.
+            history_cap: Maximum decisions kept in memory in consensus_history
+            history_log_path: Optional JSONL file that decisions are appended to
+                before they are evicted from consensus_history
         """
         self.n_versions = n_versions
         self.threshold = threshold
-        self.version_hashes = {
-            VersionID.VERSION_A: self._compute_version_hash("version_a"),
-            VersionID.VERSION_B: self._compute_version_hash("version_b"),
-            VersionID.VERSION_C: self._compute_version_hash("version_c"),
-        }
-        self.consensus_history: List[ConsensusDecision] = []
+        self.n_jobs = n_jobs
+        self._pool: Optional[ProcessPoolExecutor] = None  # Created on first parallel run
+        self.version_hashes = _VERSION_HASHES
+        self.consensus_history: Deque[ConsensusDecision] = deque(maxlen=history_cap)
+        self.history_log_path = history_log_path
         self.disagreement_count = 0
         self.consensus_count = 0
     
-    def _compute_version_hash(self, version_name: str) -> str:
-        """Compute hash of version's code/configuration."""
-        # In production, this would hash the actual code
-        data = f"MUNIN-{version_name}-v1.0-{datetime.now().isoformat()}"
-        return hashlib.sha256(data.encode()).hexdigest()[:16]
+    def close(self):
+        """Shut down the worker pool, if one was started."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+    
+    def __enter__(self) -> "NVersionProgrammingEngine":
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """The worker pool, started on first use (and again after a worker crash)."""
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=min(self.n_jobs, self.n_versions),
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._pool
+    
+    def _run_versions_in_pool(
+        self,
+        version_ids: List[VersionID],
+        input_data: Dict[str, Any],
+        graph: Dict[str, Any],
+        evidence: Dict[str, Any],
+        timestamp: str
+    ) -> List[VersionOutput]:
+        """
+        Run versions in worker processes; a version that fails casts no vote.
+        
+        A crashed worker breaks the whole pool, failing every version still running
+        on it. The pool is then replaced and those versions retried once on the fresh
+        pool, so one crash neither poisons later decisions nor reaches the voter.
+        """
+        outputs: Dict[VersionID, VersionOutput] = {}
+        pending = version_ids
+        for _ in range(2):
+            broken: List[VersionID] = []
+            try:
+                pool = self._get_pool()
+                futures = [
+                    (version_id, pool.submit(
+                        _run_version_worker,
+                        (version_id, input_data, graph, evidence, self.version_hashes[version_id], timestamp)
+                    ))
+                    for version_id in pending
+                ]
+            except BrokenProcessPool:
+                futures = []
+                broken = list(pending)
+            for version_id, future in futures:
+                try:
+                    outputs[version_id] = future.result()
+                except BrokenProcessPool:
+                    broken.append(version_id)
+                except Exception as e:
+                    log.error(f"{version_id.value} failed: {e}")
+            if not broken:
+                break
+            log.error(f"Worker pool broke running {', '.join(v.value for v in broken)}; restarting it")
+            self._pool.shutdown(wait=False)
+            self._pool = None
+            pending = broken
+        else:
+            for version_id in pending:
+                log.error(f"{version_id.value} failed: worker process crashed")
+        
+        return [outputs[version_id] for version_id in version_ids if version_id in outputs]
     
     def run_n_version_inference(
         self,
@@ -110,14 +203,21 @@ class NVersionProgrammingEngine:
         Returns a consensus decision. Only if consensus is reached should
         the command be executed.
         """
-        decision_id = f"consensus_{datetime.now().isoformat()}"
+        now = datetime.now().isoformat()
+        decision_id = f"consensus_{now}"
         
-        # Run all versions in parallel (simulated)
-        version_outputs = []
+        # Canonicalise node order once so versions propose (and are voted on) sorted targets
+        input_data = {**input_data, 'impacted_nodes': sorted(input_data.get('impacted_nodes', []))}
         
-        for version_id in [VersionID.VERSION_A, VersionID.VERSION_B, VersionID.VERSION_C]:
-            output = self._run_version(version_id, input_data, graph, evidence)
-            version_outputs.append(output)
+        # Run all versions (concurrently in worker processes when a pool is configured)
+        version_ids = [VersionID.VERSION_A, VersionID.VERSION_B, VersionID.VERSION_C]
+        if self.n_jobs > 1:
+            version_outputs = self._run_versions_in_pool(version_ids, input_data, graph, evidence, now)
+        else:
+            version_outputs = [
+                self._run_version(version_id, input_data, graph, evidence, timestamp=now)
+                for version_id in version_ids
+            ]
         
         # Determine consensus
         consensus_result, agreed_command, disagreement_details = self._determine_consensus(
@@ -132,9 +232,11 @@ class NVersionProgrammingEngine:
             agreed_command=agreed_command,
             disagreement_details=disagreement_details,
             threshold=self.threshold,
-            timestamp=datetime.now().isoformat()
+            timestamp=now
         )
         
+        if len(self.consensus_history) == self.consensus_history.maxlen:
+            self._flush_evicted(self.consensus_history[0])
         self.consensus_history.append(decision)
         
         if consensus_result == ConsensusResult.CONSENSUS:
@@ -149,7 +251,8 @@ class NVersionProgrammingEngine:
         version_id: VersionID,
         input_data: Dict[str, Any],
         graph: Dict[str, Any],
-        evidence: Dict[str, Any]
+        evidence: Dict[str, Any],
+        timestamp: Optional[str] = None
     ) -> VersionOutput:
         """
         Run a single version of the inference engine.
@@ -160,34 +263,15 @@ class NVersionProgrammingEngine:
         - Or use a different algorithm
         
         This ensures design diversity.
+        
+        timestamp: ISO timestamp of the enclosing decision (defaults to now).
         """
-        start_time = datetime.now()
-        
-        # Simulate different implementations
-        if version_id == VersionID.VERSION_A:
-            command, confidence, reasoning = self._version_a_inference(input_data, graph, evidence)
-        elif version_id == VersionID.VERSION_B:
-            command, confidence, reasoning = self._version_b_inference(input_data, graph, evidence)
-        elif version_id == VersionID.VERSION_C:
-            command, confidence, reasoning = self._version_c_inference(input_data, graph, evidence)
-        else:
-            raise ValueError(f"Unknown version: {version_id}")
-        
-        end_time = datetime.now()
-        execution_time_ms = int((end_time - start_time).total_seconds() * 1000)
-        
-        return VersionOutput(
-            version_id=version_id,
-            command=command,
-            confidence=confidence,
-            reasoning=reasoning,
-            execution_time_ms=execution_time_ms,
-            timestamp=datetime.now().isoformat(),
-            version_hash=self.version_hashes[version_id]
+        return _execute_version(
+            version_id, input_data, graph, evidence, self.version_hashes[version_id], timestamp
         )
     
+    @staticmethod
     def _version_a_inference(
-        self,
         input_data: Dict[str, Any],
         graph: Dict[str, Any],
         evidence: Dict[str, Any]
@@ -209,8 +293,8 @@ class NVersionProgrammingEngine:
         
         return command, confidence, reasoning
     
+    @staticmethod
     def _version_b_inference(
-        self,
         input_data: Dict[str, Any],
         graph: Dict[str, Any],
         evidence: Dict[str, Any]
@@ -232,8 +316,8 @@ class NVersionProgrammingEngine:
         
         return command, confidence, reasoning
     
+    @staticmethod
     def _version_c_inference(
-        self,
         input_data: Dict[str, Any],
         graph: Dict[str, Any],
         evidence: Dict[str, Any]
@@ -268,47 +352,52 @@ class NVersionProgrammingEngine:
         if len(version_outputs) < self.threshold:
             return ConsensusResult.DISAGREEMENT, None, ["Not enough versions"]
         
-        # Compare commands (simplified: compare action and target_nodes)
-        command_groups = {}
+        # Compare commands (simplified: compare action and target_nodes). Targets are
+        # normalised here so node order never counts as a disagreement; versions fed
+        # sorted impacted_nodes make this a linear pass over already-sorted lists
+        keys = [
+            (output.command.get('action', ''), tuple(sorted(output.command.get('target_nodes', []))))
+            for output in version_outputs
+        ]
         
-        for output in version_outputs:
-            # Create a key for the command (simplified comparison)
-            action = output.command.get('action', '')
-            targets = tuple(sorted(output.command.get('target_nodes', [])))
-            key = (action, targets)
-            
-            if key not in command_groups:
-                command_groups[key] = []
-            command_groups[key].append(output)
+        # Unanimity is the healthy common case: nothing to tally or report
+        # (the length check above already guarantees the threshold is met)
+        if len(set(keys)) == 1:
+            return ConsensusResult.CONSENSUS, version_outputs[0].command, []
         
-        # Find the group with the most votes
-        max_votes = max(len(group) for group in command_groups.values())
+        # Find the command with the most votes (first proposed wins ties)
+        votes = Counter(keys)
+        winner_key, max_votes = votes.most_common(1)[0]
         
         if max_votes >= self.threshold:
-            # Consensus reached
-            agreed_group = max(command_groups.values(), key=len)
-            agreed_output = agreed_group[0]  # Use first output as representative
-            
-            # Check for disagreements
-            disagreement_details = []
-            for output in version_outputs:
-                if output not in agreed_group:
-                    disagreement_details.append(
-                        f"{output.version_id.value} disagreed: {output.reasoning}"
-                    )
-            
+            # Consensus reached; first agreeing output is the representative
+            agreed_output = version_outputs[keys.index(winner_key)]
+            disagreement_details = [
+                f"{output.version_id.value} disagreed: {output.reasoning}"
+                for output, key in zip(version_outputs, keys)
+                if key != winner_key
+            ]
             return ConsensusResult.CONSENSUS, agreed_output.command, disagreement_details
         else:
             # No consensus
             disagreement_details = [
-                f"{len(group)} version(s) proposed: {group[0].command.get('action')}"
-                for group in command_groups.values()
+                f"{count} version(s) proposed: {version_outputs[keys.index(key)].command.get('action')}"
+                for key, count in votes.items()
             ]
             return ConsensusResult.DISAGREEMENT, None, disagreement_details
     
+    def _flush_evicted(self, decision: ConsensusDecision):
+        """Append a decision about to leave the bounded history to the JSONL log (if configured)."""
+        if self.history_log_path is None:
+            return
+        record = json.dumps(asdict(decision), default=lambda o: o.value if isinstance(o, Enum) else str(o))
+        with open(self.history_log_path, 'a') as f:
+            f.write(record + '\n')
+    
     def get_consensus_statistics(self) -> Dict[str, Any]:
         """Get statistics on consensus performance."""
-        total_decisions = len(self.consensus_history)
+        # Counters cover every decision; consensus_history is bounded
+        total_decisions = self.consensus_count + self.disagreement_count
         
         if total_decisions == 0:
             return {
@@ -365,6 +454,47 @@ class NVersionProgrammingEngine:
         }
 
 
+def _execute_version(
+    version_id: VersionID,
+    input_data: Dict[str, Any],
+    graph: Dict[str, Any],
+    evidence: Dict[str, Any],
+    version_hash: str,
+    timestamp: Optional[str] = None
+) -> VersionOutput:
+    """Run one version's inference and wrap it as a VersionOutput stamped with timestamp (default now)."""
+    t0 = time.perf_counter_ns()
+    
+    # Simulate different implementations
+    if version_id == VersionID.VERSION_A:
+        command, confidence, reasoning = NVersionProgrammingEngine._version_a_inference(input_data, graph, evidence)
+    elif version_id == VersionID.VERSION_B:
+        command, confidence, reasoning = NVersionProgrammingEngine._version_b_inference(input_data, graph, evidence)
+    elif version_id == VersionID.VERSION_C:
+        command, confidence, reasoning = NVersionProgrammingEngine._version_c_inference(input_data, graph, evidence)
+    else:
+        raise ValueError(f"Unknown version: {version_id}")
+    
+    execution_time_ms = (time.perf_counter_ns() - t0) // 1_000_000
+    
+    return VersionOutput(
+        version_id=version_id,
+        command=command,
+        confidence=confidence,
+        reasoning=reasoning,
+        execution_time_ms=execution_time_ms,
+        timestamp=timestamp if timestamp is not None else datetime.now().isoformat(),
+        version_hash=version_hash
+    )
+
+
+def _run_version_worker(
+    args: Tuple[VersionID, Dict[str, Any], Dict[str, Any], Dict[str, Any], str, Optional[str]]
+) -> VersionOutput:
+    """Worker for parallel version execution. Must be at module level for pickling."""
+    return _execute_version(*args)
+
+
 if __name__ == "__main__":
     # Example: N-Version Programming for Byzantine Fault Tolerance
     engine = NVersionProgrammingEngine(n_versions=3, threshold=2)
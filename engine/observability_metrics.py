@@ -3,10 +3,12 @@ Observability Metrics Collection
 
 Collects metrics for Prometheus export and monitoring dashboards.
 """
-from typing import Dict, List, Optional
-from dataclasses import dataclass, asdict
+from typing import Deque, Dict, List, Optional, Tuple
+from dataclasses import dataclass, asdict, field
 from datetime import datetime
-from collections import defaultdict
+from collections import defaultdict, deque
+import bisect
+import threading
 import time
 
 
@@ -20,14 +22,41 @@ class Metric:
     metric_type: str  # 'counter', 'gauge', 'histogram', 'summary'
 
 
+# Internal series key: (metric name, sorted label items)
+SeriesKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+# Default Prometheus histogram bucket upper bounds (a final +Inf bucket is implicit)
+DEFAULT_HISTOGRAM_BUCKETS: Tuple[float, ...] = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+
+
+@dataclass
+class HistogramState:
+    """Aggregated histogram: per-bucket counts (non-cumulative, last is +Inf), sum and count."""
+    bucket_counts: List[int] = field(default_factory=lambda: [0] * (len(DEFAULT_HISTOGRAM_BUCKETS) + 1))
+    sum: float = 0.0
+    count: int = 0
+
+
 class MetricsCollector:
     """Collects and stores metrics for observability."""
     
-    def __init__(self):
-        self.metrics: List[Metric] = []
-        self.counters: Dict[str, float] = defaultdict(float)
-        self.gauges: Dict[str, float] = {}
-        self.histograms: Dict[str, List[float]] = defaultdict(list)
+    def __init__(self, history_size: int = 0):
+        """
+        Initialize metrics collector.
+        
+        Args:
+            history_size: If > 0, also keep the most recent N raw data points in
+                self.metrics (off by default; only aggregated state is kept)
+        """
+        self.metrics: Optional[Deque[Metric]] = deque(maxlen=history_size) if history_size > 0 else None
+        self._last_metric_time = 0.0
+        # Guards all aggregated state: float += and bucket updates are read-modify-write
+        self._lock = threading.Lock()
+        self.counters: Dict[SeriesKey, float] = defaultdict(float)
+        self.gauges: Dict[SeriesKey, float] = {}
+        self.histograms: Dict[SeriesKey, HistogramState] = defaultdict(HistogramState)
     
     def increment_counter(
         self,
@@ -36,16 +65,10 @@ class MetricsCollector:
         value: float = 1.0
     ):
         """Increment a counter metric."""
-        label_key = self._make_label_key(name, labels or {})
-        self.counters[label_key] += value
-        
-        self.metrics.append(Metric(
-            name=name,
-            value=self.counters[label_key],
-            labels=labels or {},
-            timestamp=time.time(),
-            metric_type='counter'
-        ))
+        label_key = self._series_key(name, labels)
+        with self._lock:
+            self.counters[label_key] += value
+            self._record(name, self.counters[label_key], labels, 'counter')
     
     def set_gauge(
         self,
@@ -54,16 +77,10 @@ class MetricsCollector:
         labels: Optional[Dict[str, str]] = None
     ):
         """Set a gauge metric."""
-        label_key = self._make_label_key(name, labels or {})
-        self.gauges[label_key] = value
-        
-        self.metrics.append(Metric(
-            name=name,
-            value=value,
-            labels=labels or {},
-            timestamp=time.time(),
-            metric_type='gauge'
-        ))
+        label_key = self._series_key(name, labels)
+        with self._lock:
+            self.gauges[label_key] = value
+            self._record(name, value, labels, 'gauge')
     
     def observe_histogram(
         self,
@@ -72,54 +89,100 @@ class MetricsCollector:
         labels: Optional[Dict[str, str]] = None
     ):
         """Observe a histogram value."""
-        label_key = self._make_label_key(name, labels or {})
-        self.histograms[label_key].append(value)
-        
-        self.metrics.append(Metric(
-            name=name,
-            value=value,
-            labels=labels or {},
-            timestamp=time.time(),
-            metric_type='histogram'
-        ))
+        label_key = self._series_key(name, labels)
+        # First bucket whose upper bound is >= value (Prometheus 'le' semantics)
+        bucket = bisect.bisect_left(DEFAULT_HISTOGRAM_BUCKETS, value)
+        with self._lock:
+            histogram = self.histograms[label_key]
+            histogram.bucket_counts[bucket] += 1
+            histogram.sum += value
+            histogram.count += 1
+            self._record(name, value, labels, 'histogram')
+    
+    def _record(self, name: str, value: float, labels: Optional[Dict[str, str]], metric_type: str):
+        """Note the update time and, if history is enabled, keep the raw data point (caller holds the lock)."""
+        now = time.time()
+        self._last_metric_time = now
+        if self.metrics is not None:
+            self.metrics.append(Metric(
+                name=name,
+                value=value,
+                labels=labels or {},
+                timestamp=now,
+                metric_type=metric_type
+            ))
+    
+    @staticmethod
+    def _series_key(name: str, labels: Optional[Dict[str, str]]) -> SeriesKey:
+        """Create the internal key for a metric name and labels."""
+        return (name, tuple(sorted(labels.items())) if labels else ())
+    
+    @staticmethod
+    def _make_label_key(name: str, label_items: Tuple[Tuple[str, str], ...]) -> str:
+        """Format a series as Prometheus text (only needed at export time)."""
+        if not label_items:
+            return name
+        label_str = ','.join(f'{k}="{v}"' for k, v in label_items)
+        return f"{name}{{{label_str}}}"
     
-    def _make_label_key(self, name: str, labels: Dict[str, str]) -> str:
-        """Create a key from metric name and labels."""
-        label_str = ','.join(f"{k}={v}" for k, v in sorted(labels.items()))
-        return f"{name}{{{label_str}}}" if label_str else name
+    @staticmethod
+    def _group_by_name(series: Dict[SeriesKey, object]) -> Dict[str, List]:
+        """Group series by metric name so each name gets a single # TYPE line."""
+        grouped: Dict[str, List] = defaultdict(list)
+        for (name, label_items), value in series.items():
+            grouped[name].append((label_items, value))
+        return grouped
     
     def export_prometheus_format(self) -> str:
         """Export metrics in Prometheus text format."""
+        with self._lock:
+            counters = dict(self.counters)
+            gauges = dict(self.gauges)
+            histograms = {
+                key: HistogramState(list(h.bucket_counts), h.sum, h.count)
+                for key, h in self.histograms.items()
+            }
         lines = []
         
         # Export counters
-        for label_key, value in self.counters.items():
-            lines.append(f"# TYPE {label_key.split('{')[0]} counter")
-            lines.append(f"{label_key} {value}")
+        for name, series in self._group_by_name(counters).items():
+            lines.append(f"# TYPE {name} counter")
+            for label_items, value in series:
+                lines.append(f"{self._make_label_key(name, label_items)} {value}")
         
         # Export gauges
-        for label_key, value in self.gauges.items():
-            lines.append(f"# TYPE {label_key.split('{')[0]} gauge")
-            lines.append(f"{label_key} {value}")
+        for name, series in self._group_by_name(gauges).items():
+            lines.append(f"# TYPE {name} gauge")
+            for label_items, value in series:
+                lines.append(f"{self._make_label_key(name, label_items)} {value}")
         
-        # Export histograms (simplified - would compute buckets in production)
-        for label_key, values in self.histograms.items():
-            if values:
-                lines.append(f"# TYPE {label_key.split('{')[0]} histogram")
-                lines.append(f"{label_key}_sum {sum(values)}")
-                lines.append(f"{label_key}_count {len(values)}")
+        # Export histograms (cumulative buckets)
+        bucket_labels = [str(bound) for bound in DEFAULT_HISTOGRAM_BUCKETS] + ['+Inf']
+        for name, series in self._group_by_name(histograms).items():
+            series = [(label_items, h) for label_items, h in series if h.count]
+            if not series:
+                continue
+            lines.append(f"# TYPE {name} histogram")
+            for label_items, h in series:
+                cumulative = 0
+                for le, bucket_count in zip(bucket_labels, h.bucket_counts):
+                    cumulative += bucket_count
+                    lines.append(f"{self._make_label_key(name + '_bucket', label_items + (('le', le),))} {cumulative}")
+                lines.append(f"{self._make_label_key(name + '_sum', label_items)} {h.sum}")
+                lines.append(f"{self._make_label_key(name + '_count', label_items)} {h.count}")
         
         return '\n'.join(lines)
     
     def get_metrics_summary(self) -> Dict:
         """Get summary of collected metrics."""
-        return {
-            'total_metrics': len(self.metrics),
-            'counters': len(self.counters),
-            'gauges': len(self.gauges),
-            'histograms': len(self.histograms),
-            'last_metric_time': max((m.timestamp for m in self.metrics), default=0)
-        }
+        with self._lock:
+            return {
+                'total_metrics': len(self.counters) + len(self.gauges) + sum(h.count for h in self.histograms.values()),
+                'counters': len(self.counters),
+                'gauges': len(self.gauges),
+                'histograms': len(self.histograms),
+                'last_metric_time': self._last_metric_time
+            }
 
 
 # Global metrics collector instance
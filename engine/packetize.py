@@ -1,17 +1,35 @@
 """Generate Authoritative Handshake packets from incidents."""
 import json
 import hashlib
+import os
 import yaml
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import cpu_count
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Set
+from functools import lru_cache
+from itertools import chain
+from typing import Dict, List, Optional, Any, Set, Tuple, Union
 from liability_shield import LiabilityShield
 from byzantine_resilience import ByzantineResilienceEngine, integrate_byzantine_multi_sig_into_packet
 from audit_log import get_audit_log
 from engine.logger import get_logger
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 log = get_logger(__name__)
 
+# Optional: orjson for faster packet file serialization (hash preimages always use stdlib json)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Optional: Import decision integration (requires Next.js API to be running)
 try:
     from decision_integration import integrate_packet_with_decisions
@@ -20,18 +38,85 @@ except ImportError:
     DECISION_INTEGRATION_AVAILABLE = False
     log.info("Note: Decision integration not available (decision_integration.py not found)")
 
-def compute_data_hash(data: str) -> str:
-    """Compute SHA-256 hash of data."""
-    return hashlib.sha256(data.encode()).hexdigest()
+def compute_data_hash(data: Union[str, bytes]) -> str:
+    """Compute SHA-256 hash of data (str is UTF-8 encoded; bytes are hashed as-is)."""
+    if isinstance(data, str):
+        data = data.encode()
+    return hashlib.sha256(data).hexdigest()
 
-def generate_merkle_receipt(packet_content: str, previous_hash: Optional[str] = None) -> Dict:
-    """Generate Merkle-proof receipt for a packet, chaining to previous packet."""
-    packet_hash = compute_data_hash(packet_content)
+def canonical_json(obj: Any) -> bytes:
+    """
+    Canonical (sorted-key) JSON encoding used as the preimage for dataHash and packetHash.
+    
+    Deliberately stdlib json: orjson's OPT_SORT_KEYS output uses different separators,
+    escaping and float formatting, so swapping it in would change every recorded hash.
+    """
+    return json.dumps(obj, sort_keys=True).encode()
+
+def compute_provenance_data_hash(graph: Dict[str, Any], evidence: Dict[str, Any]) -> str:
+    """
+    Compute the provenance dataHash over the canonical graph and evidence JSON.
+    
+    Equal to compute_data_hash(graph_json + evidence_json), but each document is fed to
+    the hasher separately so only one serialized copy is alive at a time.
+    """
+    h = hashlib.sha256()
+    for doc in (graph, evidence):
+        h.update(canonical_json(doc))
+    return h.hexdigest()
+
+# Hash of the model configuration; constant for this engine version
+CONFIG_HASH = compute_data_hash('prototype_v1')
+
+def build_node_region_index(graph: Dict[str, Any]) -> Dict[str, str]:
+    """Map node id -> region for every graph node (missing regions are 'unknown')."""
+    node_regions: Dict[str, str] = {}
+    for node in graph['nodes']:
+        if not isinstance(node, dict) or 'id' not in node:
+            raise ValueError("Graph nodes must be dictionaries with 'id' field")
+        node_regions[node['id']] = node.get('region', 'unknown')
+    return node_regions
+
+def build_evidence_node_index(graph: Dict[str, Any], evidence: Dict[str, Any]) -> Dict[str, List[int]]:
+    """
+    Map node id -> ascending indices of evidence windows with numeric robustness touching that node.
+    
+    Evidence windows carry an edgeId, resolved to (source, target) through the graph edges;
+    legacy windows carry sourceNodeId/targetNodeId directly.
+    """
+    edge_to_endpoints: Dict[str, tuple] = {}
+    for edge in graph.get('edges', []):
+        if isinstance(edge, dict) and edge.get('id') and edge.get('source') is not None and edge.get('target') is not None:
+            edge_to_endpoints[edge['id']] = (edge['source'], edge['target'])
     
+    node_to_windows: Dict[str, List[int]] = defaultdict(list)
+    for i, e in enumerate(evidence['windows']):
+        if not isinstance(e, dict):
+            continue
+        if 'robustness' not in e or not isinstance(e['robustness'], (int, float)):
+            continue
+        edge_id = e.get('edgeId')
+        if not edge_id:
+            # Legacy: try sourceNodeId/targetNodeId if present
+            evidence_nodes = (e.get('sourceNodeId', ''), e.get('targetNodeId', ''))
+        else:
+            evidence_nodes = edge_to_endpoints.get(edge_id, ('', ''))
+        for nid in set(evidence_nodes):
+            node_to_windows[nid].append(i)
+    return dict(node_to_windows)
+
+def chain_merkle_receipt(packet_hash: str, previous_hash: Optional[str] = None) -> Dict:
+    """
+    Chain an already-computed packet hash to the previous receipt.
+    
+    Only the short "previousHash:packetHash" hex link is hashed here; the preimage
+    format matches lib/merkle.ts so receipts stay verifiable from the app.
+    """
+    # Assemble the link preimage directly as bytes
     if previous_hash:
-        combined = f"{previous_hash}:{packet_hash}"
+        combined = b"%s:%s" % (previous_hash.encode(), packet_hash.encode())
     else:
-        combined = packet_hash
+        combined = packet_hash.encode()
     
     receipt_hash = compute_data_hash(combined)
     
@@ -41,6 +126,99 @@ def generate_merkle_receipt(packet_content: str, previous_hash: Optional[str] =
         'receiptHash': receipt_hash
     }
 
+def generate_merkle_receipt(packet_content: Union[str, bytes], previous_hash: Optional[str] = None) -> Dict:
+    """Generate Merkle-proof receipt for a packet, chaining to previous packet."""
+    return chain_merkle_receipt(compute_data_hash(packet_content), previous_hash)
+
+def hash_packet(packet: Dict[str, Any]) -> str:
+    """Content hash of a packet (canonical JSON) as used for merkle.packetHash."""
+    return compute_data_hash(canonical_json(packet))
+
+def bulk_hash_packets(packets: List[Dict[str, Any]], n_jobs: int = 1) -> List[str]:
+    """
+    Content hashes for many packets, in order.
+    
+    n_jobs > 1 spreads serialization and hashing over worker processes; worthwhile
+    only for large batches (e.g. re-verifying a whole packet directory).
+    """
+    n_workers = min(n_jobs, cpu_count() or 4, len(packets))
+    if n_workers > 1:
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            return list(executor.map(hash_packet, packets, chunksize=max(1, len(packets) // (4 * n_workers))))
+    return [hash_packet(packet) for packet in packets]
+
+def _write_packet_file(path: Path, packet: Dict[str, Any]) -> None:
+    """Serialize a packet in one call (orjson when available) and write it with a single os.write (no fsync)."""
+    if ORJSON_AVAILABLE:
+        data = orjson.dumps(packet, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(packet, indent=2).encode()
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+# Re-check the schema of every generated packet (the builder already guarantees it; tests cover it)
+VALIDATE_PACKETS = os.environ.get("MUNIN_VALIDATE_PACKETS", "false").lower() == "true"
+
+# Chain tip (latest receiptHash) kept next to the packets so runs don't rescan every packet
+CHAIN_HEAD_FILENAME = 'HEAD'
+
+def read_chain_head(output_dir: Path) -> Optional[str]:
+    """
+    Latest Merkle receiptHash in output_dir.
+    
+    Reads the HEAD file; directories written before HEAD existed fall back to scanning
+    every packet and taking the newest by createdTs.
+    """
+    try:
+        head = (output_dir / CHAIN_HEAD_FILENAME).read_text().strip()
+        if head:
+            return head
+    except OSError:
+        pass
+    
+    existing_packets = []
+    for packet_file in output_dir.glob('*.json'):
+        try:
+            with open(packet_file, 'r') as f:
+                existing_packet = json.load(f)
+                if existing_packet.get('merkle', {}).get('receiptHash'):
+                    existing_packets.append(existing_packet)
+        except:
+            pass
+    
+    # Sort by creation time to get latest
+    existing_packets.sort(key=lambda p: p.get('createdTs', ''), reverse=True)
+    return existing_packets[0].get('merkle', {}).get('receiptHash') if existing_packets else None
+
+def _write_chain_head(output_dir: Path, receipt_hash: str) -> Path:
+    """Atomically replace the HEAD file with receipt_hash (no fsync); returns its path."""
+    head_path = output_dir / CHAIN_HEAD_FILENAME
+    tmp_path = output_dir / f".{CHAIN_HEAD_FILENAME}.tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, receipt_hash.encode() + b'\n')
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, head_path)
+    return head_path
+
+def _fsync_paths(paths: List[Path], directory: Path) -> None:
+    """Flush staged packet files, then their directory entry, to disk in one batch."""
+    for path in paths:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
 def determine_multi_sig_requirements(playbook: Dict, incident: Dict) -> Dict:
     """Determine multi-sig requirements based on playbook risk level and incident scope."""
     # Check for minimum_sign_off setting in playbook
@@ -91,11 +269,56 @@ def determine_multi_sig_requirements(playbook: Dict, incident: Dict) -> Dict:
         'currentSignatures': 0
     }
 
+# Incident type -> (regulatory basis, proposed action, situation summary template, outcome summary template).
+# Summary templates take n (impacted node count); outcome templates take pct (confidence percent).
+_INCIDENT_TEMPLATES: Dict[str, Tuple[str, str, str, str]] = {
+    'flood': (
+        'Complies with 2026 Flood Resilience Act, Section 4.2',
+        'Isolate affected pump stations and divert flow to backup reservoirs',
+        "Flood event detected affecting {n} nodes. Cascading impact predicted across water infrastructure.",
+        '{pct}% confidence cascade contained to affected zone with coordinated gate operations.',
+    ),
+    'drought': (
+        'Complies with 2026 Drought Resilience Act, Section 4',
+        'Divert 40% flow from Reservoir Alpha to Reservoir Beta',
+        "Drought conditions detected. Reservoir levels critical. Predicted impact to {n} dependent nodes.",
+        '{pct}% confidence reservoir diversion limits impact to pre-defined sectors.',
+    ),
+    'power_instability': (
+        'Complies with NERC Reliability Standards, EOP-011',
+        'Initiate frequency stabilization protocol and load shedding',
+        "Power frequency instability detected. Grid stability at risk. {n} nodes predicted to be impacted.",
+        '{pct}% confidence frequency restored within stability band; load shed minimised.',
+    ),
+    'chaos_multi_fault': (
+        'Complies with Civil Contingencies Act 2004, multi-sector coordination',
+        'Coordinate cross-sector response; isolate fault origins and contain cascade',
+        "Multi-fault chaos scenario affecting {n} nodes. Cross-sector cascade.",
+        '{pct}% confidence multi-fault cascade contained with cross-sector coordination.',
+    ),
+    'chaos_correlated': (
+        'Complies with Civil Contingencies Act 2004, cross-sector shadow-link response',
+        'Execute shadow-link aware response; contain correlated failure pair',
+        "Correlated (shadow-link) chaos scenario affecting {n} nodes.",
+        '{pct}% confidence correlated failure contained; shadow-link response applied.',
+    ),
+}
+
+_DEFAULT_INCIDENT_TEMPLATE: Tuple[str, str, str, str] = (
+    'General emergency protocols',
+    'Review and assess',
+    'Unknown incident type',
+    '{pct}% confidence based on pre-simulation.',
+)
+
 def generate_packet(
     incident: Dict[str, Any],
     playbook_id: str,
     graph: Dict[str, Any],
-    evidence: Dict[str, Any]
+    evidence: Dict[str, Any],
+    data_hash: Optional[str] = None,
+    node_regions: Optional[Dict[str, str]] = None,
+    evidence_index: Optional[Dict[str, List[int]]] = None
 ) -> Dict[str, Any]:
     """
     Generate a handshake packet from an incident.
@@ -105,6 +328,10 @@ def generate_packet(
         playbook_id: Identifier for the playbook to use
         graph: Dependency graph with 'nodes' and 'edges'
         evidence: Evidence windows dictionary with 'windows' list
+        data_hash: Precomputed compute_provenance_data_hash(graph, evidence); callers
+            generating many packets from the same inputs should pass it in
+        node_regions: Precomputed build_node_region_index(graph), likewise
+        evidence_index: Precomputed build_evidence_node_index(graph, evidence), likewise
     
     Returns:
         Validated handshake packet dictionary
@@ -131,76 +358,37 @@ def generate_packet(
     packet_id = f"packet_{incident['id']}_{created_ts.strftime('%Y%m%d%H%M%S')}"
     
     # Determine scope from incident timeline
-    all_impacted: Set[str] = set()
     for timeline_entry in incident['timeline']:
         if not isinstance(timeline_entry, dict):
             raise ValueError("timeline entries must be dictionaries")
         if 'impactedNodeIds' not in timeline_entry:
             raise ValueError("timeline entries must have 'impactedNodeIds' field")
-        node_ids = timeline_entry['impactedNodeIds']
-        if not isinstance(node_ids, list):
+        if not isinstance(timeline_entry['impactedNodeIds'], list):
             raise ValueError("impactedNodeIds must be a list")
-        all_impacted.update(node_ids)
+    all_impacted: Set[str] = set(chain.from_iterable(
+        timeline_entry['impactedNodeIds'] for timeline_entry in incident['timeline']
+    ))
     
     # Get regions from nodes
-    node_regions: Dict[str, str] = {}
-    for node in graph['nodes']:
-        if not isinstance(node, dict) or 'id' not in node:
-            raise ValueError("Graph nodes must be dictionaries with 'id' field")
-        node_regions[node['id']] = node.get('region', 'unknown')
+    if node_regions is None:
+        node_regions = build_node_region_index(graph)
     
-    regions: List[str] = list(set(node_regions.get(nid, 'unknown') for nid in all_impacted))
+    regions: List[str] = list({node_regions.get(nid, 'unknown') for nid in all_impacted})
     
-    # Map incident type to playbook and regulatory basis
-    regulatory_map = {
-        'flood': 'Complies with 2026 Flood Resilience Act, Section 4.2',
-        'drought': 'Complies with 2026 Drought Resilience Act, Section 4',
-        'power_instability': 'Complies with NERC Reliability Standards, EOP-011',
-        'chaos_multi_fault': 'Complies with Civil Contingencies Act 2004, multi-sector coordination',
-        'chaos_correlated': 'Complies with Civil Contingencies Act 2004, cross-sector shadow-link response',
-    }
-    
-    action_map = {
-        'flood': 'Isolate affected pump stations and divert flow to backup reservoirs',
-        'drought': 'Divert 40% flow from Reservoir Alpha to Reservoir Beta',
-        'power_instability': 'Initiate frequency stabilization protocol and load shedding',
-        'chaos_multi_fault': 'Coordinate cross-sector response; isolate fault origins and contain cascade',
-        'chaos_correlated': 'Execute shadow-link aware response; contain correlated failure pair',
-    }
+    # Per-type regulatory basis, action and summary templates (single lookup)
+    regulatory_basis, proposed_action, summary_template, outcome_template = _INCIDENT_TEMPLATES.get(
+        incident['type'], _DEFAULT_INCIDENT_TEMPLATE
+    )
     
-    summary_map = {
-        'flood': f"Flood event detected affecting {len(all_impacted)} nodes. Cascading impact predicted across water infrastructure.",
-        'drought': f"Drought conditions detected. Reservoir levels critical. Predicted impact to {len(all_impacted)} dependent nodes.",
-        'power_instability': f"Power frequency instability detected. Grid stability at risk. {len(all_impacted)} nodes predicted to be impacted.",
-        'chaos_multi_fault': f"Multi-fault chaos scenario affecting {len(all_impacted)} nodes. Cross-sector cascade.",
-        'chaos_correlated': f"Correlated (shadow-link) chaos scenario affecting {len(all_impacted)} nodes.",
-    }
+    # Compute uncertainty from evidence windows touching any impacted node (in window order)
+    if evidence_index is None:
+        evidence_index = build_evidence_node_index(graph, evidence)
+    windows = evidence['windows']
+    hits = sorted({i for nid in all_impacted for i in evidence_index.get(nid, ())})
     
-    # Build edge_id -> (source, target) so we can match evidence windows (which use edgeId) to impacted nodes
-    edge_to_endpoints: Dict[str, tuple] = {}
-    for edge in graph.get('edges', []):
-        if isinstance(edge, dict) and edge.get('id') and edge.get('source') is not None and edge.get('target') is not None:
-            edge_to_endpoints[edge['id']] = (edge['source'], edge['target'])
-
-    # Compute uncertainty from evidence (evidence windows have edgeId, not sourceNodeId/targetNodeId)
-    relevant_evidence: List[Dict[str, Any]] = []
-    for e in evidence['windows']:
-        if not isinstance(e, dict):
-            continue
-        edge_id = e.get('edgeId')
-        if not edge_id:
-            # Legacy: try sourceNodeId/targetNodeId if present
-            evidence_nodes = e.get('sourceNodeId', '') + ' ' + e.get('targetNodeId', '')
-        else:
-            endpoints = edge_to_endpoints.get(edge_id, ('', ''))
-            evidence_nodes = ' '.join(endpoints)
-        if any(nid in evidence_nodes for nid in all_impacted):
-            if 'robustness' in e and isinstance(e['robustness'], (int, float)):
-                relevant_evidence.append(e)
-    
-    if relevant_evidence:
-        robustness_values = [e['robustness'] for e in relevant_evidence]
-        avg_confidence = sum(robustness_values) / len(robustness_values)
+    if hits:
+        # Single pass over the matched windows, no intermediate list
+        avg_confidence = sum(windows[i]['robustness'] for i in hits) / len(hits)
         uncertainty = float(max(0.0, min(1.0, 1.0 - avg_confidence)))
     else:
         uncertainty = 0.3
@@ -212,10 +400,9 @@ def generate_packet(
         uncertainty_notes.append('Large blast radius increases prediction uncertainty')
     
     # Generate provenance hashes
-    graph_json = json.dumps(graph, sort_keys=True)
-    evidence_json = json.dumps(evidence, sort_keys=True)
-    config_hash = compute_data_hash('prototype_v1')
-    data_hash = compute_data_hash(graph_json + evidence_json)
+    config_hash = CONFIG_HASH
+    if data_hash is None:
+        data_hash = compute_provenance_data_hash(graph, evidence)
     
     # Compute technical verification
     # Simulated success probability based on evidence quality and scope
@@ -252,43 +439,36 @@ def generate_packet(
     
     # Outcome confidence (pre-simulated playbook result for operator decision)
     outcome_confidence = float(max(0.0, min(1.0, base_success_prob)))
-    outcome_summary_map = {
-        'flood': f'{int(outcome_confidence * 100)}% confidence cascade contained to affected zone with coordinated gate operations.',
-        'drought': f'{int(outcome_confidence * 100)}% confidence reservoir diversion limits impact to pre-defined sectors.',
-        'power_instability': f'{int(outcome_confidence * 100)}% confidence frequency restored within stability band; load shed minimised.',
-        'chaos_multi_fault': f'{int(outcome_confidence * 100)}% confidence multi-fault cascade contained with cross-sector coordination.',
-        'chaos_correlated': f'{int(outcome_confidence * 100)}% confidence correlated failure contained; shadow-link response applied.',
-    }
-    outcome_summary = str(outcome_summary_map.get(incident['type'], f'{int(outcome_confidence * 100)}% confidence based on pre-simulation.'))
+    outcome_summary = outcome_template.format(pct=int(outcome_confidence * 100))
     
     # Validate evidence refs
     evidence_refs: List[str] = []
-    for e in relevant_evidence[:5]:
+    for e in (windows[i] for i in hits[:5]):
         if 'id' in e and isinstance(e['id'], str):
             evidence_refs.append(e['id'])
     
-    # Validate packet fields
+    # Node ids and regions come from input data, so they are still coerced to str
     packet: Dict[str, Any] = {
-        'id': str(packet_id),
-        'version': int(1),
-        'createdTs': str(created_ts.isoformat()),
+        'id': packet_id,
+        'version': 1,
+        'createdTs': created_ts.isoformat(),
         'firstApprovalTs': None,  # Will be set when first approval is received
         'authorizedTs': None,  # Will be set when authorization threshold is met
         'timeToAuthorize': None,  # Will be calculated when authorized
         'timeToAuthorizeSeconds': None,  # Coordination latency metric: set when first approval received
-        'status': str('ready'),
+        'status': 'ready',
         'scope': {
             'regions': [str(r) for r in regions],
             'nodeIds': [str(nid) for nid in sorted(all_impacted)],
         },
-        'situationSummary': str(summary_map.get(incident['type'], 'Unknown incident type')),
-        'proposedAction': str(action_map.get(incident['type'], 'Review and assess')),
-        'regulatoryBasis': str(regulatory_map.get(incident['type'], 'General emergency protocols')),
-        'playbookId': str(playbook_id),
+        'situationSummary': summary_template.format(n=len(all_impacted)),
+        'proposedAction': proposed_action,
+        'regulatoryBasis': regulatory_basis,
+        'playbookId': playbook_id,
         'evidenceRefs': evidence_refs,
         'uncertainty': {
-            'overall': float(uncertainty),
-            'notes': [str(note) for note in uncertainty_notes]
+            'overall': uncertainty,
+            'notes': uncertainty_notes
         },
         'approvals': [
             {
@@ -299,9 +479,9 @@ def generate_packet(
             }
         ],
         'provenance': {
-            'modelVersion': str('prototype_v1'),
-            'configHash': str(config_hash),
-            'dataHash': str(data_hash)
+            'modelVersion': 'prototype_v1',
+            'configHash': config_hash,
+            'dataHash': data_hash
         },
         'technicalVerification': technical_verification,
         'actuatorBoundary': actuator_boundary,
@@ -309,8 +489,9 @@ def generate_packet(
         'outcomeSummary': outcome_summary,
     }
     
-    # Validate packet structure matches schema
-    _validate_packet_structure(packet)
+    # Validate packet structure matches schema (opt-in; see VALIDATE_PACKETS)
+    if VALIDATE_PACKETS:
+        _validate_packet_structure(packet)
     
     return packet
 
@@ -344,14 +525,130 @@ def _validate_packet_structure(packet: Dict[str, Any]) -> None:
     if not (0.0 <= packet['uncertainty']['overall'] <= 1.0):
         raise ValueError("Packet 'uncertainty.overall' must be between 0.0 and 1.0")
 
+# Playbook directory listings keyed by directory -> (mtime_ns, file names)
+_PLAYBOOK_LISTING_CACHE: Dict[str, Tuple[int, Set[str]]] = {}
+
+def list_playbook_files(playbooks_dir: Path) -> Set[str]:
+    """Names of files in playbooks_dir, rescanned only when the directory's mtime changes."""
+    try:
+        mtime_ns = os.stat(playbooks_dir).st_mtime_ns
+    except OSError:
+        return set()
+    key = str(playbooks_dir)
+    cached = _PLAYBOOK_LISTING_CACHE.get(key)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    names = {entry.name for entry in os.scandir(playbooks_dir) if entry.is_file()}
+    _PLAYBOOK_LISTING_CACHE[key] = (mtime_ns, names)
+    return names
+
+@lru_cache(maxsize=None)
+def _parse_playbook(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a playbook file (libyaml when available); mtime_ns is part of the cache key so edits are picked up."""
+    with open(path, 'r') as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
+def load_playbook(playbook_path: Path) -> Dict[str, Any]:
+    """Parsed playbook YAML, shared across callers (treat as read-only)."""
+    return _parse_playbook(str(playbook_path), os.stat(playbook_path).st_mtime_ns)
+
+def _build_packet(
+    job: Tuple[Dict[str, Any], str, Dict[str, Any], bool],
+    context: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Build one incident's packet (everything except the Merkle receipt, which is chained in order)."""
+    incident, playbook_id, playbook, trigger_validated = job
+    packet = generate_packet(
+        incident, playbook_id, context['graph'], context['evidence'],
+        data_hash=context['data_hash'],
+        node_regions=context['node_regions'],
+        evidence_index=context['evidence_index']
+    )
+    if trigger_validated:
+        packet['triggerValidated'] = True  # Playbook selected via live trigger evaluation
+    
+    # Determine multi-sig requirements
+    multi_sig = determine_multi_sig_requirements(playbook, incident)
+    packet['multiSig'] = multi_sig
+    
+    # Add Byzantine multi-sig for high-consequence actions (treason-proofing)
+    byzantine_engine = ByzantineResilienceEngine()
+    packet = integrate_byzantine_multi_sig_into_packet(packet, byzantine_engine)
+    
+    # Add statutory compliance (Liability Shield)
+    shield = LiabilityShield(jurisdiction='national')
+    packet = shield.enhance_handshake_with_compliance(packet, playbook)
+    
+    # Update approvals list if multi-sig requires more signers
+    if multi_sig['required'] > len(packet['approvals']):
+        # Add additional required roles for high-risk operations
+        additional_roles = ['Defense Coordination Officer', 'National Security Liaison']
+        for role in additional_roles[:multi_sig['required'] - len(packet['approvals'])]:
+            packet['approvals'].append({'role': role})
+    
+    return packet
+
+# Read-only per-run context (graph, evidence, precomputed indices) installed in each worker process
+_WORKER_CONTEXT: Dict[str, Any] = {}
+
+def _init_packet_worker(context: Dict[str, Any]) -> None:
+    """Pool initializer: ship the shared context to the worker once rather than per task."""
+    global _WORKER_CONTEXT
+    _WORKER_CONTEXT = context
+
+def _build_packet_worker(job: Tuple[Dict[str, Any], str, Dict[str, Any], bool]) -> Tuple[Dict[str, Any], str]:
+    """Worker for parallel packet generation. Must be at module level for pickling."""
+    packet = _build_packet(job, _WORKER_CONTEXT)
+    return packet, hash_packet(packet)
+
+def _resolve_playbook(
+    incident_type: str,
+    playbook_map: Dict[str, str],
+    playbook_fallback: Dict[str, str],
+    triggered_playbook_ids: Set[str],
+    available_playbooks: Set[str],
+    playbooks_dir: Path
+) -> Tuple[str, Dict[str, Any]]:
+    """Pick the playbook id for an incident type and load it (empty dict when missing)."""
+    default_id = playbook_map.get(incident_type, 'default.yaml')
+    fallback_id = playbook_fallback.get(incident_type, default_id)
+    # Prefer trigger-validated playbook when available (thesis: live data -> which playbook)
+    if default_id in triggered_playbook_ids and default_id in available_playbooks:
+        playbook_id = default_id
+    elif fallback_id != default_id and fallback_id in triggered_playbook_ids and fallback_id in available_playbooks:
+        playbook_id = fallback_id
+    else:
+        playbook_id = default_id
+    
+    # Load playbook to determine multi-sig requirements
+    if playbook_id in available_playbooks:
+        return playbook_id, load_playbook(playbooks_dir / playbook_id)
+    
+    # Try fallback playbook
+    fallback_id = playbook_fallback.get(incident_type)
+    if fallback_id:
+        if fallback_id in available_playbooks:
+            log.info(f"Using fallback playbook: {fallback_id}")
+            return fallback_id, load_playbook(playbooks_dir / fallback_id)
+        log.warning(f"Playbook {playbook_id} and fallback {fallback_id} not found, using default")
+    else:
+        log.warning(f"Playbook {playbook_id} not found, using default")
+    return 'default.yaml', {}
+
 def packetize_incidents(
     incidents_path: Path,
     graph_path: Path,
     evidence_path: Path,
     playbooks_dir: Path,
-    output_dir: Path
+    output_dir: Path,
+    n_jobs: int = 1
 ):
-    """Generate packets for all incidents with Merkle-proof receipts."""
+    """
+    Generate packets for all incidents with Merkle-proof receipts.
+    
+    n_jobs: Number of parallel workers for packet generation (1=sequential).
+    Merkle chaining, file writes and audit logging always run in incident order.
+    """
     with open(incidents_path, 'r') as f:
         incidents_data = json.load(f)
     
@@ -391,123 +688,112 @@ def packetize_incidents(
     
     output_dir.mkdir(exist_ok=True)
     
-    # Get existing packets to chain from (for Merkle receipts)
-    existing_packets = []
-    if output_dir.exists():
-        for packet_file in output_dir.glob('*.json'):
-            try:
-                with open(packet_file, 'r') as f:
-                    existing_packet = json.load(f)
-                    if existing_packet.get('merkle', {}).get('receiptHash'):
-                        existing_packets.append(existing_packet)
-            except:
-                pass
+    # Chain from the latest existing receipt (for Merkle receipts)
+    previous_hash = read_chain_head(output_dir)
     
-    # Sort by creation time to get latest
-    existing_packets.sort(key=lambda p: p.get('createdTs', ''), reverse=True)
-    previous_hash = existing_packets[0].get('merkle', {}).get('receiptHash') if existing_packets else None
+    # Provenance hash and node index are identical for every packet in this run
+    data_hash = compute_provenance_data_hash(graph, evidence)
+    node_regions = build_node_region_index(graph)
+    evidence_index = build_evidence_node_index(graph, evidence)
     
     # Initialize audit log for packet creation entries
     audit_log = get_audit_log(output_dir.parent)
     
+    # Packet files are written as they are generated and fsynced together after the loop
+    staged_paths: List[Path] = []
+    audit_records: List[Dict[str, Any]] = []
+    
+    # Resolve the playbook once per incident type (one directory scan instead of a stat per incident)
+    available_playbooks = list_playbook_files(playbooks_dir)
+    resolved_playbooks: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+    jobs: List[Tuple[Dict[str, Any], str, Dict[str, Any], bool]] = []
     for incident in incidents_data['incidents']:
-        default_id = playbook_map.get(incident['type'], 'default.yaml')
-        fallback_id = playbook_fallback.get(incident['type'], default_id)
-        # Prefer trigger-validated playbook when available (thesis: live data -> which playbook)
-        if default_id in triggered_playbook_ids and (playbooks_dir / default_id).exists():
-            playbook_id = default_id
-        elif fallback_id != default_id and fallback_id in triggered_playbook_ids and (playbooks_dir / fallback_id).exists():
-            playbook_id = fallback_id
-        else:
-            playbook_id = default_id
-        playbook_path = playbooks_dir / playbook_id
-        
-        # Load playbook to determine multi-sig requirements
-        playbook = {}
-        if playbook_path.exists():
-            with open(playbook_path, 'r') as f:
-                playbook = yaml.safe_load(f)
-        else:
-            # Try fallback playbook
-            fallback_id = playbook_fallback.get(incident['type'])
-            if fallback_id:
-                fallback_path = playbooks_dir / fallback_id
-                if fallback_path.exists():
-                    playbook_id = fallback_id
-                    playbook_path = fallback_path
-                    with open(playbook_path, 'r') as f:
-                        playbook = yaml.safe_load(f)
-                    log.info(f"Using fallback playbook: {fallback_id}")
-                else:
-                    log.warning(f"Playbook {playbook_id} and fallback {fallback_id} not found, using default")
-                    playbook_id = 'default.yaml'
-            else:
-                log.warning(f"Playbook {playbook_id} not found, using default")
-                playbook_id = 'default.yaml'
-        
-        packet = generate_packet(incident, playbook_id, graph, evidence)
-        if playbook_id in triggered_playbook_ids:
-            packet['triggerValidated'] = True  # Playbook selected via live trigger evaluation
-        
-        # Determine multi-sig requirements
-        multi_sig = determine_multi_sig_requirements(playbook, incident)
-        packet['multiSig'] = multi_sig
-        
-        # Add Byzantine multi-sig for high-consequence actions (treason-proofing)
-        byzantine_engine = ByzantineResilienceEngine()
-        packet = integrate_byzantine_multi_sig_into_packet(packet, byzantine_engine)
-        
-        # Add statutory compliance (Liability Shield)
-        shield = LiabilityShield(jurisdiction='national')
-        packet = shield.enhance_handshake_with_compliance(packet, playbook)
-        
-        # Update approvals list if multi-sig requires more signers
-        if multi_sig['required'] > len(packet['approvals']):
-            # Add additional required roles for high-risk operations
-            additional_roles = ['Defense Coordination Officer', 'National Security Liaison']
-            for role in additional_roles[:multi_sig['required'] - len(packet['approvals'])]:
-                packet['approvals'].append({'role': role})
-        
-        # Generate Merkle receipt (chain to previous packet)
-        packet_json = json.dumps(packet, sort_keys=True)
-        merkle_receipt = generate_merkle_receipt(packet_json, previous_hash)
-        packet['merkle'] = merkle_receipt
-        
-        # Update previous_hash for next iteration
-        previous_hash = merkle_receipt['receiptHash']
-        
-        packet_path = output_dir / f"{packet['id']}.json"
-        with open(packet_path, 'w') as f:
-            json.dump(packet, f, indent=2)
-        
-        log.info(f"Packet generated: {packet['id']} (Merkle: {merkle_receipt['receiptHash'][:16]}...)")
-        
-        # Integrate with decision system (if available)
-        if DECISION_INTEGRATION_AVAILABLE:
-            try:
-                decision_id = integrate_packet_with_decisions(
-                    packet, 
-                    incident['id'], 
-                    playbook_id,
-                    output_dir.parent  # Pass parent dir to create decisions/ subdirectory
-                )
-                if decision_id:
-                    log.info(f"   Decision created: {decision_id}")
-            except Exception as e:
-                log.warning(f"Decision integration failed: {e}")
-        
-        # Log packet creation to audit log
-        audit_log.append(
-            action='create',
-            actor='system',
-            packet_id=packet['id'],
-            metadata={
-                'playbook_id': playbook_id,
-                'incident_type': incident['type'],
-                'merkle_receipt_hash': merkle_receipt['receiptHash'],
-                'status': packet['status']
-            }
-        )
+        incident_type = incident['type']
+        if incident_type not in resolved_playbooks:
+            resolved_playbooks[incident_type] = _resolve_playbook(
+                incident_type, playbook_map, playbook_fallback,
+                triggered_playbook_ids, available_playbooks, playbooks_dir
+            )
+        playbook_id, playbook = resolved_playbooks[incident_type]
+        jobs.append((incident, playbook_id, playbook, playbook_id in triggered_playbook_ids))
+    
+    # Packets are independent of each other; build them (optionally in parallel) before chaining
+    context = {
+        'graph': graph,
+        'evidence': evidence,
+        'data_hash': data_hash,
+        'node_regions': node_regions,
+        'evidence_index': evidence_index,
+    }
+    n_workers = min(n_jobs, cpu_count() or 4, len(jobs))
+    if n_workers > 1:
+        with ProcessPoolExecutor(
+            max_workers=n_workers,
+            initializer=_init_packet_worker,
+            initargs=(context,)
+        ) as executor:
+            # Workers also hash their packets (content hashes don't depend on the chain)
+            built = list(executor.map(_build_packet_worker, jobs))
+        packets = [packet for packet, _ in built]
+        packet_hashes = [packet_hash for _, packet_hash in built]
+        log.info(f"Built {len(packets)} packets (parallel, {n_workers} workers)")
+    else:
+        packets = [_build_packet(job, context) for job in jobs]
+        # Packet content hashes don't depend on the chain, so hash them all up front
+        packet_hashes = bulk_hash_packets(packets)
+    
+    # Chain, write and audit sequentially: each Merkle receipt depends on the previous one
+    head_path: Optional[Path] = None
+    try:
+        for (incident, playbook_id, _, _), packet, packet_hash in zip(jobs, packets, packet_hashes):
+            # Generate Merkle receipt (chain to previous packet)
+            merkle_receipt = chain_merkle_receipt(packet_hash, previous_hash)
+            packet['merkle'] = merkle_receipt
+            
+            # Update previous_hash for next iteration
+            previous_hash = merkle_receipt['receiptHash']
+            
+            packet_path = output_dir / f"{packet['id']}.json"
+            _write_packet_file(packet_path, packet)
+            staged_paths.append(packet_path)
+            # Advance HEAD with every packet so an interrupted run never leaves it behind the packets on disk
+            head_path = _write_chain_head(output_dir, previous_hash)
+            
+            # Log packet creation to audit log (queued as soon as the packet is on disk,
+            # appended in one batch when the loop ends)
+            audit_records.append({
+                'action': 'create',
+                'actor': 'system',
+                'packet_id': packet['id'],
+                'metadata': {
+                    'playbook_id': playbook_id,
+                    'incident_type': incident['type'],
+                    'merkle_receipt_hash': merkle_receipt['receiptHash'],
+                    'status': packet['status']
+                }
+            })
+            
+            log.info(f"Packet generated: {packet['id']} (Merkle: {merkle_receipt['receiptHash'][:16]}...)")
+            
+            # Integrate with decision system (if available)
+            if DECISION_INTEGRATION_AVAILABLE:
+                try:
+                    decision_id = integrate_packet_with_decisions(
+                        packet, 
+                        incident['id'], 
+                        playbook_id,
+                        output_dir.parent  # Pass parent dir to create decisions/ subdirectory
+                    )
+                    if decision_id:
+                        log.info(f"   Decision created: {decision_id}")
+                except Exception as e:
+                    log.warning(f"Decision integration failed: {e}")
+    finally:
+        # Audit entries and the fsync cover every packet written, even if the run stops early
+        audit_log.append_batch(audit_records)
+        if head_path is not None:
+            staged_paths.append(head_path)
+        _fsync_paths(staged_paths, output_dir)
     
     # Verify audit log chain
     verification = audit_log.verify_chain()
@@ -10,9 +10,9 @@ from typing import Dict, List, Tuple, Optional
 from pathlib import Path
 import json
 import hashlib
+from collections import OrderedDict
 from functools import lru_cache
 from multiprocessing import Pool, cpu_count
-import joblib
 from config import GraphInferenceConfig
 
 
@@ -32,6 +32,26 @@ def compute_correlation_batch(
     return results
 
 
+# Time-series frame installed once in each worker process by _init_correlation_worker
+_WORKER_DF: Optional[pd.DataFrame] = None
+
+
+def _init_correlation_worker(df: pd.DataFrame) -> None:
+    """Pool initializer: ship the DataFrame to each worker once rather than per pair."""
+    global _WORKER_DF
+    _WORKER_DF = df
+
+
+def _correlation_batch_worker(
+    pairs: List[Tuple[str, str]],
+    max_lag_seconds: int,
+    min_samples: int
+) -> List[Tuple[str, str, float, int]]:
+    """Worker for parallel correlation computation. Must be at module level for pickling."""
+    batch = [(source, target, _WORKER_DF[source], _WORKER_DF[target]) for source, target in pairs]
+    return compute_correlation_batch(batch, max_lag_seconds, min_samples)
+
+
 def parallelize_correlation_computation(
     df: pd.DataFrame,
     node_pairs: List[Tuple[str, str]],
@@ -43,20 +63,15 @@ def parallelize_correlation_computation(
     if n_jobs is None:
         n_jobs = max(1, cpu_count() - 1)
     
-    # Prepare batches
+    # Prepare batches of column names; workers slice the series from their own copy of df
     batch_size = max(1, len(node_pairs) // n_jobs)
-    batches = []
-    
-    for i in range(0, len(node_pairs), batch_size):
-        batch = []
-        for source, target in node_pairs[i:i+batch_size]:
-            batch.append((source, target, df[source], df[target]))
-        batches.append(batch)
+    batches = [node_pairs[i:i+batch_size] for i in range(0, len(node_pairs), batch_size)]
+    used_columns = list(dict.fromkeys(node for pair in node_pairs for node in pair))
     
     # Compute in parallel
-    with Pool(processes=n_jobs) as pool:
+    with Pool(processes=n_jobs, initializer=_init_correlation_worker, initargs=(df[used_columns],)) as pool:
         batch_results = pool.starmap(
-            compute_correlation_batch,
+            _correlation_batch_worker,
             [(batch, max_lag_seconds, min_samples) for batch in batches]
         )
     
@@ -92,9 +107,23 @@ def downsample_timeseries(
     error_bounds = {}
     
     downsampled = df.resample(resample_interval).agg(method)
+    if len(df) == 0:
+        return downsampled, error_bounds
+    
+    # Compute error bounds (max deviation from original). Gap-free columns share one
+    # nearest-sample alignment, so their errors are computed as a single array op.
+    gap_free = df.notna().all(axis=0).to_numpy()
+    if gap_free.any():
+        nearest = df.index.get_indexer(downsampled.index, method='nearest')
+        aligned = df.loc[:, gap_free].to_numpy(dtype=np.float64)[nearest]
+        deviations = np.abs(aligned - downsampled.loc[:, gap_free].to_numpy(dtype=np.float64))
+        has_value = ~np.isnan(deviations)
+        max_errors = np.where(has_value, deviations, 0.0).max(axis=0)
+        for col, error, any_value in zip(df.columns[gap_free], max_errors, has_value.any(axis=0)):
+            if any_value:
+                error_bounds[col] = float(error)
     
-    # Compute error bounds (max deviation from original)
-    for col in df.columns:
+    for col in df.columns[~gap_free]:
         original = df[col].dropna()
         downsampled_col = downsampled[col].dropna()
         
@@ -104,32 +133,67 @@ def downsample_timeseries(
             errors = abs(aligned - downsampled_col)
             error_bounds[col] = float(errors.max()) if len(errors) > 0 else 0.0
     
-    return downsampled, error_bounds
+    # Report bounds in column order
+    return downsampled, {col: error_bounds[col] for col in df.columns if col in error_bounds}
 
 
-def _correlation_impl(
-    source_hash: str,
-    target_hash: int,
-    max_lag: int,
-    min_samples: int,
-) -> Tuple[float, int]:
-    """Internal: correlation from cache lookup. Hashes map to precomputed (corr, lag)."""
-    # In production, this would look up (source_hash, target_hash) in a persistent cache
-    # populated by compute_correlation_with_lag. For now, return sentinel to indicate cache miss.
-    return float('nan'), -1
+def _index_digest(index: pd.Index) -> bytes:
+    """Digest of a series index (timestamps matter for lagged correlation)."""
+    if isinstance(index, pd.DatetimeIndex):
+        data = index.as_unit('ns').asi8.tobytes()
+    else:
+        data = pd.util.hash_pandas_object(index, index=False).to_numpy().tobytes()
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def _values_fingerprint(index_digest: bytes, series: pd.Series) -> str:
+    h = hashlib.blake2b(index_digest, digest_size=16)
+    h.update(np.ascontiguousarray(series.to_numpy(dtype=np.float64)).tobytes())
+    return h.hexdigest()
+
+
+def series_fingerprint(series: pd.Series) -> str:
+    """Content hash of a series' timestamps and values, stable across runs."""
+    return _values_fingerprint(_index_digest(series.index), series)
+
+
+def fingerprint_columns(df: pd.DataFrame) -> Dict[str, str]:
+    """series_fingerprint for every column, hashing the shared index only once."""
+    index_digest = _index_digest(df.index)
+    return {col: _values_fingerprint(index_digest, df[col]) for col in df.columns}
+
+
+# Content-addressed correlation results:
+# (source fingerprint, target fingerprint, max_lag, min_samples) -> (corr, lag)
+CORRELATION_CACHE_SIZE = 100_000
+_CORRELATION_CACHE: "OrderedDict[Tuple[str, str, int, int], Tuple[float, int]]" = OrderedDict()
 
 
-@lru_cache(maxsize=1000)
 def cached_correlation(
-    source_hash: str,
-    target_hash: int,
+    series1: pd.Series,
+    series2: pd.Series,
     max_lag: int,
-    min_samples: int
+    min_samples: int,
+    fingerprints: Optional[Tuple[str, str]] = None
 ) -> Tuple[float, int]:
     """Cached correlation computation (for stable asset pairs).
-    Returns (corr, lag) from cache if hit; (nan, -1) on miss (caller should compute and populate).
+    Keyed on series content, so unchanged pairs hit across calls; pass precomputed
+    fingerprints (see fingerprint_columns) to avoid rehashing a column for every pair.
     """
-    return _correlation_impl(source_hash, target_hash, max_lag, min_samples)
+    if fingerprints is None:
+        fingerprints = (series_fingerprint(series1), series_fingerprint(series2))
+    key = (fingerprints[0], fingerprints[1], max_lag, min_samples)
+    
+    result = _CORRELATION_CACHE.get(key)
+    if result is not None:
+        _CORRELATION_CACHE.move_to_end(key)
+        return result
+    
+    result = compute_and_cache_correlation(series1, series2, max_lag, min_samples)
+    _CORRELATION_CACHE[key] = result
+    if len(_CORRELATION_CACHE) > CORRELATION_CACHE_SIZE:
+        _CORRELATION_CACHE.popitem(last=False)
+    return result
 
 
 def compute_and_cache_correlation(
@@ -143,21 +207,28 @@ def compute_and_cache_correlation(
     return compute_correlation_with_lag(series1, series2, max_lag_seconds, min_samples)
 
 
+@lru_cache(maxsize=8)
+def _projection_matrix(projection_dim: int, n_samples: int) -> np.ndarray:
+    """Deterministic (seed 42) Gaussian projection matrix, shared read-only across calls."""
+    matrix = np.random.RandomState(42).randn(projection_dim, n_samples)
+    matrix.setflags(write=False)
+    return matrix
+
+
 def fast_approximate_correlation(
     series1: pd.Series,
     series2: pd.Series,
     projection_dim: int = 10
 ) -> float:
     """Fast approximate correlation using random projections."""
-    # Random projection for dimensionality reduction
-    np.random.seed(42)  # Deterministic projections
-    projection_matrix = np.random.randn(projection_dim, len(series1))
+    # Random projection for dimensionality reduction (deterministic, cached per length)
+    projection_matrix = _projection_matrix(projection_dim, len(series1))
     
-    proj1 = projection_matrix @ series1.values
-    proj2 = projection_matrix @ series2.values
+    # Project both series with a single matmul
+    proj = projection_matrix @ np.column_stack((series1.values, series2.values))
     
     # Compute correlation on projections
-    return float(np.corrcoef(proj1, proj2)[0, 1])
+    return float(np.corrcoef(proj[:, 0], proj[:, 1])[0, 1])
 
 
 def intra_sector_correlation_fast_path(
@@ -203,42 +274,54 @@ def adaptive_batch_size(n_nodes: int, n_samples: int, n_cores: int) -> int:
 def vectorized_sensor_health(df: pd.DataFrame) -> Dict[str, Dict]:
     """Vectorized sensor health computation using NumPy broadcasting."""
     health = {}
+    if len(df.columns) == 0:
+        return health
     
-    for col in df.columns:
-        series = df[col].dropna()
-        
-        if len(series) < 10:
+    # One float64 pass over the frame; every statistic below is a column-wise reduction
+    arr = df.to_numpy(dtype=np.float64)
+    valid = ~np.isnan(arr)
+    values = np.where(valid, arr, 0.0)
+    n_valid = valid.sum(axis=0)
+    
+    def masked_mean_std(mask: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Per-column mean and sample std (ddof=1) over the masked entries."""
+        with np.errstate(invalid='ignore', divide='ignore'):
+            n = mask.sum(axis=0)
+            mean = np.where(mask, values, 0.0).sum(axis=0) / n
+            sq_dev = np.where(mask, (values - mean) ** 2, 0.0).sum(axis=0)
+            std = np.sqrt(sq_dev / (n - 1))
+        return mean, std
+    
+    mean_vals, std_vals = masked_mean_std(valid)
+    missing_ratio = 1.0 - n_valid / max(len(df), 1)
+    cv = std_vals / (np.abs(mean_vals) + 1e-10)
+    
+    # Drift detection: split each column's observed values (NaNs skipped) in half
+    rank = np.cumsum(valid, axis=0) - 1
+    first_half = valid & (rank < n_valid // 2)
+    first_mean, first_std = masked_mean_std(first_half)
+    second_mean, second_std = masked_mean_std(valid & ~first_half)
+    mean_diff = np.abs(second_mean - first_mean)
+    pooled_std = (first_std + second_std) / 2
+    drift = (pooled_std > 0) & (mean_diff > 2.0 * pooled_std)
+    
+    # Compute observability score
+    missingness_score = 1.0 - np.minimum(missing_ratio, 1.0)
+    noise_score = np.minimum(1.0, cv * 10)
+    drift_score = np.where(drift, 0.5, 0.0)
+    observability = missingness_score * 0.4 + noise_score * 0.3 + drift_score * 0.2
+    
+    for i, col in enumerate(df.columns):
+        if n_valid[i] < 10:
             health[col] = {'status': 'insufficient_data', 'score': 0.0}
             continue
-        
-        # Vectorized computations
-        missing_ratio = series.isna().sum() / len(df[col])
-        mean_val = float(series.mean())
-        std_val = float(series.std())
-        cv = std_val / (abs(mean_val) + 1e-10)
-        
-        # Vectorized drift detection
-        half_point = len(series) // 2
-        first_half_mean = float(series.iloc[:half_point].mean())
-        second_half_mean = float(series.iloc[half_point:].mean())
-        mean_diff = abs(second_half_mean - first_half_mean)
-        pooled_std = (series.iloc[:half_point].std() + series.iloc[half_point:].std()) / 2
-        
-        drift_detected = mean_diff > (2.0 * pooled_std) if pooled_std > 0 else False
-        
-        # Compute observability score
-        missingness_score = 1.0 - min(missing_ratio, 1.0)
-        noise_score = min(1.0, cv * 10)
-        drift_score = 0.0 if not drift_detected else 0.5
-        
-        observability = (missingness_score * 0.4 + noise_score * 0.3 + drift_score * 0.2)
-        
+        score = float(observability[i])
         health[col] = {
-            'status': 'ok' if observability > 0.7 else 'degraded' if observability > 0.4 else 'failed',
-            'score': float(observability),
-            'missing_ratio': float(missing_ratio),
-            'cv': float(cv),
-            'drift_detected': drift_detected
+            'status': 'ok' if score > 0.7 else 'degraded' if score > 0.4 else 'failed',
+            'score': score,
+            'missing_ratio': float(missing_ratio[i]),
+            'cv': float(cv[i]),
+            'drift_detected': bool(drift[i])
         }
     
     return health
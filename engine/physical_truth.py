@@ -4,6 +4,8 @@ Integrates physics_ingest.py and physical_verification.py with shared fingerprin
 
 Provides a single interface for verifying digital SCADA readings against physical reality.
 """
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing import cpu_count
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 from dataclasses import dataclass, asdict
@@ -25,8 +27,26 @@ from physical_verification import (
     VerificationResult
 )
 
+# Optional: orjson for faster fingerprint file serialization
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
-@dataclass
+# Physics-ingest fingerprint types whose reading measures the same quantity as the
+# SCADA value (e.g. a physical pressure tap); vibration amplitude or RF noise level
+# is not comparable to a digital reading such as pump rpm
+_VALUE_COMPARABLE_SIGNALS = frozenset({SignalType.PRESSURE_PHYSICAL})
+
+# Signal-type names accepted in physical_signal_data, in upper and lower case
+_SIGNAL_TYPES: Dict[str, PhysicalSignalType] = {
+    **{name: member for name, member in PhysicalSignalType.__members__.items()},
+    **{name.lower(): member for name, member in PhysicalSignalType.__members__.items()},
+}
+
+
+@dataclass(slots=True)
 class UnifiedFingerprint:
     """Unified fingerprint combining physics ingest and physical verification data."""
     sensor_id: str
@@ -45,10 +65,12 @@ class UnifiedFingerprint:
     last_updated: str = None
     
     def __post_init__(self):
-        if self.created_at is None:
-            self.created_at = datetime.now().isoformat()
-        if self.last_updated is None:
-            self.last_updated = datetime.now().isoformat()
+        if self.created_at is None or self.last_updated is None:
+            now = datetime.now().isoformat()
+            if self.created_at is None:
+                self.created_at = now
+            if self.last_updated is None:
+                self.last_updated = now
 
 
 class UnifiedPhysicalTruthEngine:
@@ -105,7 +127,9 @@ class UnifiedPhysicalTruthEngine:
         Args:
             sensor_id: Sensor identifier
             digital_reading: {'parameter': str, 'value': float, 'unit': str, 'timestamp': str}
-            physical_signal_data: {'signal_type': str, 'frequency_hz': float, 'amplitude': float, ...}
+            physical_signal_data: {'signal_type': str, 'frequency_hz': float, 'amplitude': float, ...};
+                'value' is a physical measurement of the digital parameter, compared
+                directly when the physics ingest fingerprint measures that quantity
         
         Returns:
             Unified verification result
@@ -118,28 +142,49 @@ class UnifiedPhysicalTruthEngine:
                 'confidence': 0.0
             }
         
-        # Use physics ingest verification
+        # Timestamp missing readings once, not per dataclass field
+        digital_timestamp = digital_reading.get('timestamp')
+        physical_timestamp = physical_signal_data.get('timestamp')
+        if digital_timestamp is None or physical_timestamp is None:
+            now = datetime.now().isoformat()
+            digital_timestamp = now if digital_timestamp is None else digital_timestamp
+            physical_timestamp = now if physical_timestamp is None else physical_timestamp
+        
+        amplitude = physical_signal_data.get('amplitude', 0.0)
+        signal_type_name = physical_signal_data.get('signal_type', 'ACOUSTIC')
+        signal_type = _SIGNAL_TYPES.get(signal_type_name)
+        if signal_type is None:
+            signal_type = _SIGNAL_TYPES.get(signal_type_name.upper())
+        
+        # Use physics ingest verification when a registered baseline measures the same
+        # quantity as the digital reading and a numeric physical value is given
         physics_ingest_result = None
-        if fingerprint.physics_ingest_fingerprint:
-            try:
-                import numpy as np
-                # Convert physical signal data to numpy array for physics ingest
-                # (simplified - would use actual signal data in production)
-                signal_array = np.array([physical_signal_data.get('amplitude', 0.0)])
-                
-                physics_ingest_result = self.physics_ingest.verify_signal_against_fingerprint(
+        ingest_fingerprint = fingerprint.physics_ingest_fingerprint
+        physical_value = physical_signal_data.get('value')
+        if ingest_fingerprint is not None and ingest_fingerprint.signal_type in _VALUE_COMPARABLE_SIGNALS \
+                and isinstance(physical_value, (int, float)):
+            physics_ingest_result = self.physics_ingest.verify_digital_against_physical(
+                sensor_id=sensor_id,
+                digital_signal=PhysicsIngestSignal(
+                    signal_type=SignalType.SCADA_DIGITAL,
+                    timestamp=digital_timestamp,
+                    value=digital_reading.get('value', 0.0),
+                    sensor_id=sensor_id
+                ),
+                physical_signal=PhysicsIngestSignal(
+                    signal_type=ingest_fingerprint.signal_type,
+                    timestamp=physical_timestamp,
+                    value=float(physical_value),
                     sensor_id=sensor_id,
-                    digital_signal_value=digital_reading.get('value', 0.0),
-                    physical_signal_data=signal_array
+                    location=physical_signal_data.get('location', '')
                 )
-            except Exception as e:
-                pass  # Fallback to physical verification
+            )
         
-        # Use physical verification
+        # Use physical verification when the signal type is one it understands
         physical_verif_result = None
-        try:
+        if signal_type is not None:
             digital_reading_obj = DigitalReading(
-                timestamp=digital_reading.get('timestamp', datetime.now().isoformat()),
+                timestamp=digital_timestamp,
                 parameter=digital_reading.get('parameter', 'unknown'),
                 value=digital_reading.get('value', 0.0),
                 unit=digital_reading.get('unit', ''),
@@ -148,40 +193,45 @@ class UnifiedPhysicalTruthEngine:
             )
             
             physical_signal_obj = PhysicalVerifSignal(
-                signal_type=PhysicalSignalType[physical_signal_data.get('signal_type', 'ACOUSTIC').upper()],
-                timestamp=physical_signal_data.get('timestamp', datetime.now().isoformat()),
+                signal_type=signal_type,
+                timestamp=physical_timestamp,
                 frequency_hz=physical_signal_data.get('frequency_hz', 0.0),
-                amplitude=physical_signal_data.get('amplitude', 0.0),
+                amplitude=amplitude,
                 harmonics=physical_signal_data.get('harmonics', []),
                 noise_level=physical_signal_data.get('noise_level', 0.0),
                 sensor_id=sensor_id,
                 location=physical_signal_data.get('location', '')
             )
             
-            physical_verif_result = self.physical_verif.verify_physical_signal(
+            physical_verif_result = self.physical_verif.verify_digital_reading(
                 asset_id=sensor_id,
+                asset_type=fingerprint.asset_type,
                 digital_reading=digital_reading_obj,
                 physical_signal=physical_signal_obj
             )
-        except Exception as e:
-            pass  # Fallback to physics ingest result
         
         # Combine results
         if physics_ingest_result and physical_verif_result:
-            # Both available - use higher confidence
-            if physics_ingest_result.confidence >= physical_verif_result.confidence:
-                primary_result = physics_ingest_result
+            # Both available - use higher confidence; the branch fixes the primary's type
+            pi_confidence = physics_ingest_result.confidence
+            pv_confidence = physical_verif_result.confidence
+            if pi_confidence >= pv_confidence:
+                verified = physics_ingest_result.signals_match
+                discrepancy_type = physics_ingest_result.discrepancy_type
+                reasoning = f'Physics ingest verification: {discrepancy_type or "verified"}; {physical_verif_result.reasoning}'
+                verification_time_ms = physics_ingest_result.verification_time_ms
             else:
-                primary_result = physical_verif_result
+                verified = physical_verif_result.verification_result == VerificationResult.VERIFIED
+                discrepancy_type = None if verified else physical_verif_result.verification_result.value
+                reasoning = physical_verif_result.reasoning
+                verification_time_ms = 0.0
             
             return {
-                'verified': primary_result.signals_match if hasattr(primary_result, 'signals_match') else \
-                           (physical_verif_result.verification_result == VerificationResult.VERIFIED),
-                'confidence': max(physics_ingest_result.confidence, physical_verif_result.confidence),
-                'discrepancy_type': primary_result.discrepancy_type if hasattr(primary_result, 'discrepancy_type') else \
-                                  (physical_verif_result.verification_result.value if physical_verif_result.verification_result != VerificationResult.VERIFIED else None),
-                'reasoning': physical_verif_result.reasoning,
-                'verification_time_ms': primary_result.verification_time_ms if hasattr(primary_result, 'verification_time_ms') else 0.0
+                'verified': verified,
+                'confidence': max(pi_confidence, pv_confidence),
+                'discrepancy_type': discrepancy_type,
+                'reasoning': reasoning,
+                'verification_time_ms': verification_time_ms
             }
         elif physics_ingest_result:
             return {
@@ -206,6 +256,23 @@ class UnifiedPhysicalTruthEngine:
                 'confidence': 0.0
             }
     
+    def verify_many(
+        self,
+        tasks: List[Tuple[str, Dict, Dict]],
+        n_jobs: int = 1
+    ) -> List[Dict]:
+        """
+        Run verify_digital_vs_physical for many (sensor_id, digital_reading, physical_signal_data) tasks.
+        
+        With n_jobs > 1 the tasks run on a thread pool (threads, not processes, so the
+        sub-engines' histories stay on this instance). Results are in task order.
+        """
+        n_workers = min(n_jobs, cpu_count() or 4, len(tasks))
+        if n_workers <= 1:
+            return [self.verify_digital_vs_physical(*task) for task in tasks]
+        with ThreadPoolExecutor(max_workers=n_workers) as executor:
+            return list(executor.map(lambda task: self.verify_digital_vs_physical(*task), tasks))
+    
     def detect_hardware_hack(
         self,
         sensor_id: str,
@@ -237,7 +304,7 @@ class UnifiedPhysicalTruthEngine:
         return list(self.unified_fingerprints.values())
     
     def save_fingerprints(self, output_path: str):
-        """Save fingerprints to JSON file."""
+        """Save fingerprints to JSON file (serialized with orjson when available)."""
         fingerprints_data = {
             'fingerprints': [
                 {
@@ -253,8 +320,12 @@ class UnifiedPhysicalTruthEngine:
             ]
         }
         
-        with open(output_path, 'w') as f:
-            json.dump(fingerprints_data, f, indent=2)
+        if ORJSON_AVAILABLE:
+            data = orjson.dumps(fingerprints_data, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(fingerprints_data, indent=2).encode()
+        with open(output_path, 'wb') as f:
+            f.write(data)
 
 
 # Global instance
@@ -14,14 +14,24 @@ not live sensor acquisition.
 """
 
 import json
+import threading
+from collections import Counter, deque
+from functools import lru_cache
 import numpy as np
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass, asdict
+from scipy.fft import next_fast_len, rfft
+from typing import Deque, Dict, List, Optional, Tuple
+from dataclasses import dataclass, asdict, field
 from enum import Enum
 from datetime import datetime
 
 from engine.logger import get_logger
 
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 log = get_logger(__name__)
 
 
@@ -43,7 +53,7 @@ class VerificationResult(Enum):
     TAMPERING_DETECTED = "tampering_detected"  # Evidence of tampering
 
 
-@dataclass
+@dataclass(slots=True)
 class PhysicalSignal:
     """Measurement of a physical signal."""
     signal_type: PhysicalSignalType
@@ -54,9 +64,14 @@ class PhysicalSignal:
     noise_level: float  # Background noise
     sensor_id: str
     location: str
+    # Harmonics as a sorted float64 array, built once at ingestion for the harmonic check
+    sorted_harmonics: np.ndarray = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.sorted_harmonics = np.sort(np.asarray(self.harmonics, dtype=np.float64))
 
 
-@dataclass
+@dataclass(slots=True)
 class DigitalReading:
     """Digital reading from SCADA/OT system."""
     timestamp: str
@@ -67,7 +82,7 @@ class DigitalReading:
     sensor_id: str
 
 
-@dataclass
+@dataclass(slots=True)
 class PhysicalVerification:
     """Result of comparing physical signal to digital reading."""
     asset_id: str
@@ -84,6 +99,105 @@ class PhysicalVerification:
             self.timestamp = datetime.now().isoformat()
 
 
+# Integer codes used by PhysicalVerificationEngine.verify_batch: code i is RESULT_CODES[i]
+RESULT_CODES: Tuple[VerificationResult, ...] = tuple(VerificationResult)
+_CODE = {result: np.int8(i) for i, result in enumerate(RESULT_CODES)}
+
+
+# Expected frequency mappings for different asset types. Read-only: per-type
+# conversion constants are cached by _asset_profile().
+EXPECTED_FREQUENCIES: Dict[str, Dict] = {
+    "pump": {
+        "rpm_to_hz": 1.0 / 60.0,  # RPM to Hz conversion
+        "expected_harmonics": (1.0, 2.0, 3.0),  # Multiples of base frequency
+    },
+    "turbine": {
+        "rpm_to_hz": 1.0 / 60.0,
+        "expected_harmonics": (1.0, 2.0, 3.0, 4.0),
+    },
+    "generator": {
+        "rpm_to_hz": 1.0 / 60.0,
+        "expected_harmonics": (1.0, 2.0),  # 50Hz or 60Hz grid frequency
+    },
+    "compressor": {
+        "rpm_to_hz": 1.0 / 60.0,
+        "expected_harmonics": (1.0, 2.0, 3.0),
+    },
+}
+
+
+@lru_cache(maxsize=None)
+def _asset_profile(asset_type: str) -> Tuple[float, np.ndarray, np.ndarray]:
+    """
+    (rpm_to_hz, harmonic multipliers, critical-harmonic mask) for an asset type.
+    
+    Unknown types fall back to 1/60 with no harmonic expectations. Arrays are
+    read-only since they are shared between calls.
+    """
+    freq_map = EXPECTED_FREQUENCIES.get(asset_type, {})
+    multipliers = np.asarray(freq_map.get("expected_harmonics", ()), dtype=np.float64)
+    critical = multipliers <= 2.0  # First two harmonics are critical
+    multipliers.setflags(write=False)
+    critical.setflags(write=False)
+    return freq_map.get("rpm_to_hz", 1.0 / 60.0), multipliers, critical
+
+
+# Integer asset codes accepted by verify_batch: code i is ASSET_TYPES[i], and
+# UNKNOWN_ASSET_CODE stands for any type without a frequency mapping
+ASSET_TYPES: Tuple[str, ...] = tuple(EXPECTED_FREQUENCIES)
+UNKNOWN_ASSET_CODE = len(ASSET_TYPES)
+_ASSET_CODES: Dict[str, int] = {asset_type: i for i, asset_type in enumerate(ASSET_TYPES)}
+_PROFILES_BY_CODE = [_asset_profile(asset_type) for asset_type in ASSET_TYPES] + [_asset_profile(None)]
+_RPM_TO_HZ_BY_CODE = np.array([profile[0] for profile in _PROFILES_BY_CODE], dtype=np.float64)
+
+
+def _harmonics_kernel_py(
+    base_freq: float, multipliers: np.ndarray, critical: np.ndarray, measured: np.ndarray
+) -> bool:
+    """
+    Loop form of the harmonic check for numba: stops at the first measured hit for
+    each critical harmonic and at the first critical miss, with no temporaries.
+    """
+    for i in range(multipliers.shape[0]):
+        if not critical[i]:
+            continue
+        expected = base_freq * multipliers[i]
+        tolerance = expected * 0.1
+        hit = False
+        for j in range(measured.shape[0]):
+            if abs(measured[j] - expected) < tolerance:
+                hit = True
+                break
+        if not hit:
+            return False
+    return True
+
+
+_harmonics_kernel = numba.njit(cache=True)(_harmonics_kernel_py) if NUMBA_AVAILABLE else None
+
+
+def _harmonics_match(physical_freq: float, measured: np.ndarray, multipliers: np.ndarray, critical: np.ndarray) -> bool:
+    """
+    Check if a physical signal has the expected harmonic structure.
+    
+    measured must be a sorted float64 array (see PhysicalSignal.sorted_harmonics).
+    Only the critical (first two) harmonics have to be present. Each is matched
+    against its nearest measured harmonic, found by binary search (or the compiled
+    loop when numba is installed).
+    """
+    if _harmonics_kernel is not None:
+        return bool(_harmonics_kernel(float(physical_freq), multipliers, critical, measured))
+    expected = physical_freq * multipliers[critical]
+    if measured.size == 0:
+        return expected.size == 0
+    idx = np.searchsorted(measured, expected)
+    left = measured[np.maximum(idx - 1, 0)]
+    right = measured[np.minimum(idx, measured.size - 1)]
+    # fmin: a NaN neighbour must not hide a finite hit on the other side
+    nearest = np.fmin(np.abs(left - expected), np.abs(right - expected))
+    return bool((nearest < expected * 0.1).all())
+
+
 class PhysicalVerificationEngine:
     """
     Physical Verification Engine: Return to Atoms
@@ -92,48 +206,72 @@ class PhysicalVerificationEngine:
     This provides defense against Stuxnet-style attacks where digital sensors are compromised.
     """
     
+    # Verifications retained in verification_history (and counted by the summary)
+    HISTORY_MAXLEN = 10_000
+    
     def __init__(self):
-        # Expected frequency mappings for different asset types
-        self.expected_frequencies: Dict[str, Dict[str, float]] = {
-            "pump": {
-                "rpm_to_hz": 1.0 / 60.0,  # RPM to Hz conversion
-                "expected_harmonics": [1.0, 2.0, 3.0],  # Multiples of base frequency
-            },
-            "turbine": {
-                "rpm_to_hz": 1.0 / 60.0,
-                "expected_harmonics": [1.0, 2.0, 3.0, 4.0],
-            },
-            "generator": {
-                "rpm_to_hz": 1.0 / 60.0,
-                "expected_harmonics": [1.0, 2.0],  # 50Hz or 60Hz grid frequency
-            },
-            "compressor": {
-                "rpm_to_hz": 1.0 / 60.0,
-                "expected_harmonics": [1.0, 2.0, 3.0],
-            },
-        }
+        self.expected_frequencies: Dict[str, Dict] = EXPECTED_FREQUENCIES
         
-        self.verification_history: List[PhysicalVerification] = []
+        self.verification_history: Deque[PhysicalVerification] = deque(maxlen=self.HISTORY_MAXLEN)
+        # Result counts over verification_history, kept in step with the deque
+        self._result_counts: Counter = Counter()
+        self._history_lock = threading.Lock()
+    
+    @staticmethod
+    def dominant_frequency(samples: np.ndarray, sample_rate_hz: float) -> float:
+        """
+        Dominant frequency (Hz) of a raw sample buffer.
+        
+        Uses a real FFT (padded to a fast length) and Jacobsen's 3-point interpolation
+        on the complex spectrum around the peak bin, so the estimate is sub-bin accurate
+        without heavy zero-padding. float32 input is kept as float32.
+        """
+        x = np.asarray(samples)
+        if x.dtype != np.float32:
+            x = x.astype(np.float64)
+        if x.size < 3:
+            return 0.0
+        x = x - x.mean()  # Drop DC so it cannot be picked as the peak
+        
+        n_fft = next_fast_len(x.size, real=True)
+        spectrum = rfft(x, n=n_fft)
+        k = int(np.argmax(np.abs(spectrum[1:]))) + 1
+        
+        delta = 0.0
+        if k < len(spectrum) - 1:
+            prev_bin, peak_bin, next_bin = spectrum[k - 1], spectrum[k], spectrum[k + 1]
+            denominator = 2 * peak_bin - prev_bin - next_bin
+            if denominator != 0:
+                delta = float(np.real((prev_bin - next_bin) / denominator))
+        return (k + delta) * sample_rate_hz / n_fft
     
     def verify_digital_reading(
         self,
         asset_id: str,
         asset_type: str,
         digital_reading: DigitalReading,
-        physical_signal: PhysicalSignal
+        physical_signal: PhysicalSignal,
+        raw_samples: Optional[np.ndarray] = None,
+        sample_rate_hz: Optional[float] = None
     ) -> PhysicalVerification:
         """
         Verify a digital reading against a physical signal.
         
+        When raw_samples (and sample_rate_hz) are given, the physical frequency is derived
+        from them with dominant_frequency() instead of physical_signal.frequency_hz.
+        
         Returns PhysicalVerification with result indicating if digital matches physical reality.
         """
+        physical_freq = physical_signal.frequency_hz
+        if raw_samples is not None and sample_rate_hz:
+            physical_freq = self.dominant_frequency(raw_samples, sample_rate_hz)
+        
         # Get expected frequency mapping for this asset type
-        freq_map = self.expected_frequencies.get(asset_type, {})
+        rpm_to_hz, multipliers, critical = _asset_profile(asset_type)
         
         # Convert digital reading to expected frequency
         expected_freq = None
         if digital_reading.parameter == "rpm":
-            rpm_to_hz = freq_map.get("rpm_to_hz", 1.0 / 60.0)
             expected_freq = digital_reading.value * rpm_to_hz
         elif digital_reading.parameter == "frequency":
             expected_freq = digital_reading.value
@@ -146,44 +284,29 @@ class PhysicalVerificationEngine:
         
         if expected_freq is not None:
             # Calculate frequency difference
-            freq_diff = abs(physical_signal.frequency_hz - expected_freq)
+            freq_diff = abs(physical_freq - expected_freq)
             freq_tolerance = expected_freq * 0.05  # 5% tolerance
             
             if freq_diff <= freq_tolerance:
                 # Frequencies match - digital reading is likely correct
                 verification_result = VerificationResult.VERIFIED
                 confidence = 1.0 - (freq_diff / expected_freq)
-                reasoning_parts.append(f"Physical frequency ({physical_signal.frequency_hz:.2f} Hz) matches expected ({expected_freq:.2f} Hz)")
+                reasoning_parts.append(f"Physical frequency ({physical_freq:.2f} Hz) matches expected ({expected_freq:.2f} Hz)")
             else:
                 # Frequencies don't match - digital reading may be compromised
                 verification_result = VerificationResult.MISMATCH
                 discrepancy = freq_diff
                 confidence = 0.8  # High confidence in mismatch
                 reasoning_parts.append(
-                    f"DISCREPANCY: Physical frequency ({physical_signal.frequency_hz:.2f} Hz) does not match "
+                    f"DISCREPANCY: Physical frequency ({physical_freq:.2f} Hz) does not match "
                     f"digital reading ({expected_freq:.2f} Hz). Difference: {freq_diff:.2f} Hz. "
                     f"Possible sensor tampering or SCADA compromise."
                 )
         
         # Check for expected harmonics
         if physical_signal.harmonics:
-            expected_harmonics = freq_map.get("expected_harmonics", [])
-            if expected_harmonics:
-                # Check if physical signal has expected harmonic structure
-                base_freq = physical_signal.frequency_hz
-                harmonic_match = True
-                for harmonic_mult in expected_harmonics:
-                    expected_harmonic = base_freq * harmonic_mult
-                    # Check if this harmonic exists in the signal
-                    found_harmonic = any(
-                        abs(h - expected_harmonic) < expected_harmonic * 0.1
-                        for h in physical_signal.harmonics
-                    )
-                    if not found_harmonic and harmonic_mult <= 2.0:  # First two harmonics are critical
-                        harmonic_match = False
-                        break
-                
-                if not harmonic_match:
+            if multipliers.size:
+                if not _harmonics_match(physical_freq, physical_signal.sorted_harmonics, multipliers, critical):
                     if verification_result == VerificationResult.VERIFIED:
                         verification_result = VerificationResult.INCONCLUSIVE
                         confidence = 0.5
@@ -208,9 +331,98 @@ class PhysicalVerificationEngine:
             reasoning=reasoning
         )
         
-        self.verification_history.append(verification)
+        self._record(verification)
         return verification
     
+    def _record(self, verification: PhysicalVerification):
+        """Append to the bounded history, keeping the result counts in step (thread-safe)."""
+        with self._history_lock:
+            if len(self.verification_history) == self.verification_history.maxlen:
+                self._result_counts[self.verification_history[0].verification_result] -= 1
+            self.verification_history.append(verification)
+            self._result_counts[verification.verification_result] += 1
+    
+    def verify_batch(
+        self,
+        asset_types: np.ndarray,
+        parameters: np.ndarray,
+        values: np.ndarray,
+        phys_freq: np.ndarray,
+        noise: np.ndarray,
+        amp: np.ndarray,
+        phys_harmonics: Optional[List[np.ndarray]] = None
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Verify many digital readings against physical signals at once.
+        
+        Applies the same rules as verify_digital_reading over aligned arrays (one
+        row per reading) instead of one Python call per record. Rows are not added
+        to verification_history and no reasoning text is produced.
+        
+        asset_types may hold type names or integer codes (see ASSET_TYPES); with
+        codes the per-row constants are a single array lookup. Frequencies are
+        compared in float64; noise and amplitude are used in the dtype supplied
+        (float32 sensor arrays are not upcast).
+        
+        Returns:
+            (codes, confidence, discrepancy): int8 result codes indexing RESULT_CODES,
+            float64 confidences, and float64 discrepancies (NaN where there is none)
+        """
+        asset_codes = np.asarray(asset_types)
+        if asset_codes.dtype.kind not in "iu":
+            # Names -> codes once per distinct type
+            kinds, inverse = np.unique(asset_codes, return_inverse=True)
+            asset_codes = np.array(
+                [_ASSET_CODES.get(str(k), UNKNOWN_ASSET_CODE) for k in kinds], dtype=np.intp
+            )[inverse]
+        parameters = np.asarray(parameters)
+        values = np.asarray(values, dtype=np.float64)
+        phys_freq = np.asarray(phys_freq, dtype=np.float64)
+        n = len(values)
+        
+        rpm_to_hz = _RPM_TO_HZ_BY_CODE[asset_codes]
+        
+        expected = np.full(n, np.nan)
+        is_rpm = parameters == "rpm"
+        is_freq = parameters == "frequency"
+        expected[is_rpm] = values[is_rpm] * rpm_to_hz[is_rpm]
+        expected[is_freq] = values[is_freq]
+        has_expected = is_rpm | is_freq
+        
+        freq_diff = np.abs(phys_freq - expected)
+        within = freq_diff <= expected * 0.05  # 5% tolerance
+        verified = has_expected & within
+        mismatch = has_expected & ~within
+        
+        codes = np.full(n, _CODE[VerificationResult.INCONCLUSIVE], dtype=np.int8)
+        confidence = np.zeros(n)
+        discrepancy = np.full(n, np.nan)
+        codes[verified] = _CODE[VerificationResult.VERIFIED]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            confidence[verified] = 1.0 - freq_diff[verified] / expected[verified]
+        codes[mismatch] = _CODE[VerificationResult.MISMATCH]
+        confidence[mismatch] = 0.8
+        discrepancy[mismatch] = freq_diff[mismatch]
+        
+        # Harmonic lists are ragged; only rows that are currently verified can change
+        if phys_harmonics is not None:
+            for i in np.flatnonzero(verified):
+                if len(phys_harmonics[i]) == 0:
+                    continue
+                _, multipliers, critical = _PROFILES_BY_CODE[asset_codes[i]]
+                # Each row's harmonics are used once, so they are sorted here as they come in
+                measured = np.sort(np.asarray(phys_harmonics[i], dtype=np.float64))
+                if multipliers.size and not _harmonics_match(phys_freq[i], measured, multipliers, critical):
+                    codes[i] = _CODE[VerificationResult.INCONCLUSIVE]
+                    confidence[i] = 0.5
+        
+        # High noise-to-signal ratio on an otherwise verified reading is a sensor fault
+        fault = (codes == _CODE[VerificationResult.VERIFIED]) & (np.asarray(noise) > np.asarray(amp) * 0.5)
+        codes[fault] = _CODE[VerificationResult.SENSOR_FAULT]
+        confidence[fault] = 0.6
+        
+        return codes, confidence, discrepancy
+    
     def detect_tampering(self, asset_id: str, recent_verifications: List[PhysicalVerification]) -> Dict:
         """
         Detect patterns indicating tampering across multiple verifications.
@@ -248,14 +460,14 @@ class PhysicalVerificationEngine:
         }
     
     def get_verification_summary(self) -> Dict:
-        """Get summary of physical verifications."""
+        """Get summary of the retained physical verifications."""
         total = len(self.verification_history)
         if total == 0:
             return {'total': 0}
         
-        verified = sum(1 for v in self.verification_history if v.verification_result == VerificationResult.VERIFIED)
-        mismatches = sum(1 for v in self.verification_history if v.verification_result == VerificationResult.MISMATCH)
-        tampering = sum(1 for v in self.verification_history if v.verification_result == VerificationResult.TAMPERING_DETECTED)
+        verified = self._result_counts[VerificationResult.VERIFIED]
+        mismatches = self._result_counts[VerificationResult.MISMATCH]
+        tampering = self._result_counts[VerificationResult.TAMPERING_DETECTED]
         
         return {
             'total_verifications': total,
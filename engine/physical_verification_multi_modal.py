@@ -3,10 +3,13 @@ Multi-Modal Physical Verification
 
 Supports multiple signal modalities per asset (acoustic, RF, vibration, thermal).
 """
-from typing import Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Dict, List, Mapping, NamedTuple, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
+import time
 import numpy as np
 
 
@@ -20,6 +23,73 @@ class SignalModality(Enum):
     OPTICAL = "optical"
 
 
+@lru_cache(maxsize=4096)
+def _iso_to_epoch(iso_timestamp: str) -> float:
+    """Epoch seconds for an ISO timestamp; cached since fingerprints are checked repeatedly."""
+    return datetime.fromisoformat(iso_timestamp).timestamp()
+
+
+class AcousticData(NamedTuple):
+    """Enrolled acoustic (or vibration) values."""
+    frequency_hz: float
+    amplitude: float
+
+
+class RFData(NamedTuple):
+    """Enrolled RF values."""
+    power_dbm: float
+
+
+class ThermalData(NamedTuple):
+    """Enrolled thermal values."""
+    temperature_c: float
+
+
+# Typed record of the compared values per modality (vibration uses the acoustic rule)
+MODALITY_DATA = {
+    SignalModality.ACOUSTIC: AcousticData,
+    SignalModality.VIBRATION: AcousticData,
+    SignalModality.RF: RFData,
+    SignalModality.THERMAL: ThermalData,
+}
+
+# Fields compared per modality by the batch path
+BATCH_FIELDS: Dict[SignalModality, Tuple[str, ...]] = {
+    modality: data_type._fields for modality, data_type in MODALITY_DATA.items()
+}
+
+
+# Vectorised comparison rules for verify_batch, keyed by modality. They mirror the
+# scalar _verify_* methods (kept in plain Python for per-sensor speed); np.maximum
+# propagates NaN like the scalar max(nan, floor) and np.fmin caps a NaN error at 1
+# like min(1.0, nan). The batch/per-sensor parity test keeps the two in step.
+def _ratio_diff(expected: np.ndarray, current: np.ndarray) -> np.ndarray:
+    """Relative difference for positive quantities (frequency, amplitude)."""
+    return np.abs(expected - current) / np.maximum(expected, 1e-10)
+
+
+def _scaled_diff(expected: np.ndarray, current: np.ndarray) -> np.ndarray:
+    """Difference relative to |expected|, floored at 1 (dBm and degrees sit near or below zero)."""
+    return np.abs(expected - current) / np.maximum(np.abs(expected), 1.0)
+
+
+# Difference rule per compared field, keyed by modality
+MODALITY_DIFFS = {
+    SignalModality.ACOUSTIC: AcousticData(_ratio_diff, _ratio_diff),
+    SignalModality.VIBRATION: AcousticData(_ratio_diff, _ratio_diff),
+    SignalModality.RF: RFData(_scaled_diff),
+    SignalModality.THERMAL: ThermalData(_scaled_diff),
+}
+
+
+def _batch_confidence(modality: SignalModality, expected: NamedTuple, current: NamedTuple) -> np.ndarray:
+    """Per-sensor confidence arrays: one minus the mean field difference, clipped to [0, 1]."""
+    rules = MODALITY_DIFFS[modality]
+    with np.errstate(invalid="ignore"):  # inf - inf and inf / inf give NaN, as in the scalar rules
+        error = sum(rule(e, c) for rule, e, c in zip(rules, expected, current)) / len(rules)
+    return 1.0 - np.fmin(1.0, error)
+
+
 @dataclass
 class MultiModalFingerprint:
     """Fingerprint combining multiple signal modalities."""
@@ -37,6 +107,27 @@ class MultiModalPhysicalVerification:
     def __init__(self):
         self.fingerprints: Dict[str, MultiModalFingerprint] = {}
         self.re_enrollment_schedule_days: int = 90  # Re-enroll every 90 days
+        
+        # Per-modality verifiers (vibration uses the acoustic frequency/amplitude rule)
+        self._verifiers = {
+            SignalModality.ACOUSTIC: self._verify_acoustic,
+            SignalModality.VIBRATION: self._verify_acoustic,
+            SignalModality.RF: self._verify_rf,
+            SignalModality.THERMAL: self._verify_thermal,
+        }
+        
+        # Enrolled values as typed records per sensor and modality, so verification
+        # reads attributes instead of dict lookups: sensor -> (read-only snapshot of
+        # the enrolled modalities, {modality: (snapshot data, record)})
+        self._expected_data: Dict[str, Tuple[Mapping, Dict[SignalModality, Tuple[Mapping, NamedTuple]]]] = {}
+        
+        # Structure-of-arrays copy of enrolled values for verify_batch: one row per
+        # sensor, grown geometrically on enrollment
+        self._sensor_idx: Dict[str, int] = {}
+        self._capacity = 0
+        self._expected: Dict[Tuple[SignalModality, str], np.ndarray] = {}
+        self._enrolled: Dict[SignalModality, np.ndarray] = {}
+        self._modality_count = np.zeros(0, dtype=np.int64)
     
     def enroll_fingerprint(
         self,
@@ -46,18 +137,69 @@ class MultiModalPhysicalVerification:
         metadata: Optional[Dict] = None
     ) -> MultiModalFingerprint:
         """Enroll baseline fingerprint with multiple modalities."""
+        now = datetime.now().isoformat()
         fingerprint = MultiModalFingerprint(
             sensor_id=sensor_id,
             asset_type=asset_type,
             modalities=modality_data,
-            created_at=datetime.now().isoformat(),
-            last_updated=datetime.now().isoformat(),
+            created_at=now,
+            last_updated=now,
             enrollment_metadata=metadata or {}
         )
         
         self.fingerprints[sensor_id] = fingerprint
+        # Read-only snapshot: the typed records and batch arrays below are built from it
+        snapshot = MappingProxyType({modality: MappingProxyType(dict(data)) for modality, data in modality_data.items()})
+        records = {
+            modality: (data, self._build_record(modality, data))
+            for modality, data in snapshot.items() if modality in MODALITY_DATA
+        }
+        self._expected_data[sensor_id] = (snapshot, records)
+        self._store_batch_row(sensor_id, snapshot)
         return fingerprint
     
+    def get_enrolled_modalities(self, sensor_id: str) -> Optional[Mapping[SignalModality, Mapping]]:
+        """Read-only view of the modality values captured when the sensor was enrolled."""
+        cached = self._expected_data.get(sensor_id)
+        return cached[0] if cached is not None else None
+    
+    @staticmethod
+    def _build_record(modality: SignalModality, data: Mapping) -> NamedTuple:
+        """Typed record of a modality's compared values (missing fields read as 0)."""
+        data_type = MODALITY_DATA[modality]
+        return data_type(*(data.get(field, 0) for field in data_type._fields))
+    
+    def _store_batch_row(self, sensor_id: str, modality_data: Dict[SignalModality, Dict]):
+        """Write a sensor's enrolled values into the batch arrays (missing fields read as 0, as in the per-sensor path)."""
+        row = self._sensor_idx.get(sensor_id)
+        if row is None:
+            row = len(self._sensor_idx)
+            if row == self._capacity:
+                self._grow(max(16, 2 * self._capacity))
+            self._sensor_idx[sensor_id] = row
+        
+        for modality, fields in BATCH_FIELDS.items():
+            data = modality_data.get(modality)
+            self._enrolled[modality][row] = data is not None
+            for field in fields:
+                self._expected[(modality, field)][row] = data.get(field, 0) if data is not None else 0.0
+        self._modality_count[row] = len(modality_data)
+    
+    def _grow(self, capacity: int):
+        """Resize the batch arrays to hold `capacity` sensors."""
+        def grown(array: Optional[np.ndarray], dtype) -> np.ndarray:
+            new = np.zeros(capacity, dtype=dtype)
+            if array is not None:
+                new[:len(array)] = array
+            return new
+        
+        for modality, fields in BATCH_FIELDS.items():
+            self._enrolled[modality] = grown(self._enrolled.get(modality), bool)
+            for field in fields:
+                self._expected[(modality, field)] = grown(self._expected.get((modality, field)), np.float64)
+        self._modality_count = grown(self._modality_count, np.int64)
+        self._capacity = capacity
+    
     def verify_multi_modal(
         self,
         sensor_id: str,
@@ -75,8 +217,10 @@ class MultiModalPhysicalVerification:
         
         modality_results = {}
         overall_confidence = 0.0
+        cached = self._expected_data.get(sensor_id)
+        cached_records = cached[1] if cached is not None else {}
         
-        for modality, expected_data in fingerprint.modalities.items():
+        for modality, data in fingerprint.modalities.items():
             if modality not in current_signals:
                 modality_results[modality.value] = {
                     'verified': False,
@@ -85,8 +229,16 @@ class MultiModalPhysicalVerification:
                 }
                 continue
             
+            # Enrolled record while the fingerprint's data for this modality is unchanged;
+            # edited, replaced or directly inserted fingerprints are read afresh
+            entry = cached_records.get(modality)
+            if entry is not None and entry[0] == data:
+                expected = entry[1]
+            else:
+                expected = self._build_record(modality, data) if modality in MODALITY_DATA else None
+            
             current_data = current_signals[modality]
-            result = self._verify_modality(modality, expected_data, current_data, tolerance)
+            result = self._verify_modality(modality, expected, current_data, tolerance)
             modality_results[modality.value] = result
             overall_confidence += result.get('confidence', 0.0)
         
@@ -95,45 +247,81 @@ class MultiModalPhysicalVerification:
         overall_confidence = overall_confidence / num_modalities if num_modalities > 0 else 0.0
         
         verified = overall_confidence > (1.0 - tolerance)
+        age_days = self._get_fingerprint_age_days(fingerprint)
         
         return {
             'verified': verified,
             'confidence': overall_confidence,
             'modality_results': modality_results,
-            'fingerprint_age_days': self._get_fingerprint_age_days(fingerprint),
-            're_enrollment_needed': self._check_re_enrollment_needed(fingerprint)
+            'fingerprint_age_days': age_days,
+            're_enrollment_needed': age_days > self.re_enrollment_schedule_days
         }
     
+    def verify_batch(
+        self,
+        sensor_ids: List[str],
+        current_signals: Dict[SignalModality, Dict[str, np.ndarray]],
+        tolerance: float = 0.1
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Verify many sensors at once against their enrolled fingerprints.
+        
+        current_signals maps each modality to arrays aligned with sensor_ids (e.g.
+        {ACOUSTIC: {'frequency_hz': ..., 'amplitude': ...}}). Applies the same rules as
+        verify_multi_modal to the values captured at enrollment: a modality absent from
+        current_signals contributes zero confidence, unknown sensors get zero.
+        
+        Returns:
+            (confidence, verified) arrays aligned with sensor_ids
+        """
+        n = len(sensor_ids)
+        rows = np.fromiter((self._sensor_idx.get(s, -1) for s in sensor_ids), dtype=np.intp, count=n)
+        known = rows >= 0
+        rows = np.where(known, rows, 0)
+        
+        total = np.zeros(n)
+        for modality, current in current_signals.items():
+            fields = BATCH_FIELDS.get(modality)
+            if fields is None or not self._capacity:
+                continue
+            data_type = MODALITY_DATA[modality]
+            expected = data_type(*(self._expected[(modality, field)][rows] for field in fields))
+            values = data_type(*(np.asarray(current.get(field, 0), dtype=np.float64) for field in fields))
+            confidence = _batch_confidence(modality, expected, values)
+            total += np.where(self._enrolled[modality][rows], confidence, 0.0)
+        
+        counts = self._modality_count[rows] if self._capacity else np.zeros(n, dtype=np.int64)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            overall = np.where(known & (counts > 0), total / np.maximum(counts, 1), 0.0)
+        return overall, overall > (1.0 - tolerance)
+    
     def _verify_modality(
         self,
         modality: SignalModality,
-        expected: Dict,
+        expected: Optional[NamedTuple],
         current: Dict,
         tolerance: float
     ) -> Dict:
         """Verify a single modality."""
-        if modality == SignalModality.ACOUSTIC:
-            return self._verify_acoustic(expected, current, tolerance)
-        elif modality == SignalModality.VIBRATION:
-            return self._verify_vibration(expected, current, tolerance)
-        elif modality == SignalModality.RF:
-            return self._verify_rf(expected, current, tolerance)
-        elif modality == SignalModality.THERMAL:
-            return self._verify_thermal(expected, current, tolerance)
-        else:
+        verifier = self._verifiers.get(modality)
+        if verifier is None:
             return {'verified': False, 'reason': f'Unsupported modality {modality}', 'confidence': 0.0}
+        return verifier(expected, current, tolerance)
     
-    def _verify_acoustic(self, expected: Dict, current: Dict, tolerance: float) -> Dict:
+    def _verify_acoustic(self, expected: AcousticData, current: Dict, tolerance: float) -> Dict:
         """Verify acoustic signals."""
-        expected_freq = expected.get('frequency_hz', 0)
+        # Conditional expressions instead of max()/min() calls; operand order keeps the
+        # builtins' NaN behaviour (max(nan, 1e-10) is nan, min(1.0, nan) is 1.0)
+        expected_freq = expected.frequency_hz
         current_freq = current.get('frequency_hz', 0)
-        freq_diff = abs(expected_freq - current_freq) / max(expected_freq, 1e-10)
+        freq_diff = abs(expected_freq - current_freq) / (1e-10 if 1e-10 > expected_freq else expected_freq)
         
-        expected_amp = expected.get('amplitude', 0)
+        expected_amp = expected.amplitude
         current_amp = current.get('amplitude', 0)
-        amp_diff = abs(expected_amp - current_amp) / max(expected_amp, 1e-10)
+        amp_diff = abs(expected_amp - current_amp) / (1e-10 if 1e-10 > expected_amp else expected_amp)
         
-        confidence = 1.0 - min(1.0, (freq_diff + amp_diff) / 2.0)
+        error = (freq_diff + amp_diff) / 2.0
+        confidence = 1.0 - (error if error < 1.0 else 1.0)
         verified = confidence > (1.0 - tolerance)
         
         return {
@@ -143,18 +331,14 @@ class MultiModalPhysicalVerification:
             'amplitude_match': amp_diff < tolerance
         }
     
-    def _verify_vibration(self, expected: Dict, current: Dict, tolerance: float) -> Dict:
-        """Verify vibration signals."""
-        # Similar to acoustic but with different parameters
-        return self._verify_acoustic(expected, current, tolerance)
-    
-    def _verify_rf(self, expected: Dict, current: Dict, tolerance: float) -> Dict:
+    def _verify_rf(self, expected: RFData, current: Dict, tolerance: float) -> Dict:
         """Verify RF signals."""
-        expected_power = expected.get('power_dbm', 0)
+        expected_power = expected.power_dbm
         current_power = current.get('power_dbm', 0)
-        power_diff = abs(expected_power - current_power) / max(abs(expected_power), 1.0)
+        scale = abs(expected_power)
+        power_diff = abs(expected_power - current_power) / (1.0 if 1.0 > scale else scale)
         
-        confidence = 1.0 - min(1.0, power_diff)
+        confidence = 1.0 - (power_diff if power_diff < 1.0 else 1.0)
         verified = confidence > (1.0 - tolerance)
         
         return {
@@ -163,13 +347,14 @@ class MultiModalPhysicalVerification:
             'power_match': power_diff < tolerance
         }
     
-    def _verify_thermal(self, expected: Dict, current: Dict, tolerance: float) -> Dict:
+    def _verify_thermal(self, expected: ThermalData, current: Dict, tolerance: float) -> Dict:
         """Verify thermal signals."""
-        expected_temp = expected.get('temperature_c', 0)
+        expected_temp = expected.temperature_c
         current_temp = current.get('temperature_c', 0)
-        temp_diff = abs(expected_temp - current_temp) / max(abs(expected_temp), 1.0)
+        scale = abs(expected_temp)
+        temp_diff = abs(expected_temp - current_temp) / (1.0 if 1.0 > scale else scale)
         
-        confidence = 1.0 - min(1.0, temp_diff)
+        confidence = 1.0 - (temp_diff if temp_diff < 1.0 else 1.0)
         verified = confidence > (1.0 - tolerance)
         
         return {
@@ -180,9 +365,7 @@ class MultiModalPhysicalVerification:
     
     def _get_fingerprint_age_days(self, fingerprint: MultiModalFingerprint) -> float:
         """Get age of fingerprint in days."""
-        created = datetime.fromisoformat(fingerprint.created_at)
-        now = datetime.now()
-        return (now - created).total_seconds() / (24 * 3600)
+        return (time.time() - _iso_to_epoch(fingerprint.created_at)) / (24 * 3600)
     
     def _check_re_enrollment_needed(self, fingerprint: MultiModalFingerprint) -> bool:
         """Check if re-enrollment is needed based on age."""
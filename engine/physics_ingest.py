@@ -20,11 +20,17 @@ The value-comparison and FFT-peak-matching logic is real and tested;
 the sensor integration layer is not.
 """
 
+from collections import deque
+from functools import lru_cache
+import threading
+import time
 import numpy as np
 import pandas as pd
-from typing import Dict, List, Optional, Tuple
+from scipy.fft import rfft
+from scipy.signal import find_peaks
+from typing import Deque, Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 
 from engine.logger import get_logger
@@ -40,6 +46,47 @@ class SignalType(Enum):
     PRESSURE_PHYSICAL = "pressure_physical"  # Physical pressure measurement
 
 
+@lru_cache(maxsize=32)
+def _abs_fft_frequencies(n: int, sample_rate: float) -> np.ndarray:
+    """|Frequency| of each bin of an n-point FFT (np.fft order); cached, read-only."""
+    frequencies = np.abs(np.fft.fftfreq(n, 1/sample_rate))
+    frequencies.setflags(write=False)
+    return frequencies
+
+
+def _frequency_peaks(spectrum: np.ndarray, sample_rate: float, num_peaks: int) -> np.ndarray:
+    """
+    Sorted frequencies of the num_peaks strongest peaks of a power spectrum (np.fft order).
+    
+    Peaks are local maxima from scipy.signal.find_peaks (at least 5% of the maximum in
+    prominence, n//100 bins apart), so one broad peak is not reported as several adjacent
+    bins. Only the non-negative half is searched: the spectrum of a real signal is symmetric.
+    """
+    spectrum = np.asarray(spectrum)
+    n = len(spectrum)
+    if n == 0 or num_peaks <= 0:
+        return np.empty(0)
+    half = spectrum[:n // 2 + 1]
+    peak_indices, _ = find_peaks(half, distance=max(1, n // 100), prominence=half.max() * 0.05)
+    if len(peak_indices) > num_peaks:
+        peak_indices = peak_indices[np.argpartition(half[peak_indices], -num_peaks)[-num_peaks:]]
+    peaks = _abs_fft_frequencies(n, sample_rate)[peak_indices]  # fancy index: already a fresh array
+    peaks.sort()
+    return peaks
+
+
+def _power_spectrum(signal_data: np.ndarray, workers: Optional[int] = None) -> np.ndarray:
+    """Full-length (np.fft bin order) power spectrum of real signals along the last axis."""
+    n = signal_data.shape[-1]
+    half = rfft(signal_data, axis=-1, workers=workers)
+    
+    # Power spectrum (magnitude squared) without the complex abs temporary
+    half_power = half.real ** 2 + half.imag ** 2
+    
+    # Real input: negative-frequency bins mirror the positive ones
+    return np.concatenate((half_power, half_power[..., 1:(n + 1) // 2][..., ::-1]), axis=-1)
+
+
 @dataclass
 class PhysicalSignal:
     """A physical signal measurement."""
@@ -60,6 +107,16 @@ class SignalFingerprint:
     expected_amplitude_range: Tuple[float, float]
     expected_phase_characteristics: Dict[str, float]
     baseline_spectrum: np.ndarray  # Baseline FFT spectrum
+    # Derived once at construction for verification: expected peaks as a sorted array
+    # and the peaks of the baseline spectrum (reused when a signal carries the baseline)
+    expected_peaks: np.ndarray = field(init=False, repr=False, compare=False)
+    baseline_peaks: Optional[np.ndarray] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.expected_peaks = np.sort(np.asarray(self.expected_frequency_peaks, dtype=np.float64))
+        self.baseline_peaks = (
+            _frequency_peaks(self.baseline_spectrum, 1000.0, 5) if self.baseline_spectrum is not None else None
+        )
 
 
 @dataclass
@@ -70,8 +127,13 @@ class SignalVerification:
     signals_match: bool
     confidence: float
     discrepancy_type: Optional[str] = None  # 'hardware_hack', 'sensor_failure', 'normal_variance'
-    timestamp: datetime = None
+    timestamp_ns: int = field(default_factory=time.time_ns)
     verification_time_ms: float = 0.0
+    
+    @property
+    def timestamp(self) -> datetime:
+        """Wall-clock time of the verification, built on demand."""
+        return datetime.fromtimestamp(self.timestamp_ns / 1e9)
 
 
 class PhysicsIngestEngine:
@@ -80,9 +142,17 @@ class PhysicsIngestEngine:
     using acoustic vibration and RF fingerprinting.
     """
     
+    # Verifications retained in verification_history (and covered by the statistics)
+    HISTORY_MAXLEN = 10_000
+    
     def __init__(self):
         self.signal_fingerprints: Dict[str, SignalFingerprint] = {}
-        self.verification_history: List[SignalVerification] = []
+        self.verification_history: Deque[SignalVerification] = deque(maxlen=self.HISTORY_MAXLEN)
+        # Running totals over verification_history, kept in step with the deque
+        self._match_count = 0
+        self._hack_count = 0
+        self._time_sum_ms = 0.0
+        self._history_lock = threading.Lock()
     
     def register_sensor_fingerprint(
         self,
@@ -106,25 +176,48 @@ class PhysicsIngestEngine:
         return fingerprint
     
     def compute_frequency_spectrum(self, signal_data: np.ndarray, sample_rate: float = 1000.0) -> np.ndarray:
-        """Compute FFT frequency spectrum of a signal."""
-        # Apply FFT
-        fft = np.fft.fft(signal_data)
-        frequencies = np.fft.fftfreq(len(signal_data), 1/sample_rate)
-        
-        # Return power spectrum (magnitude squared)
-        power_spectrum = np.abs(fft) ** 2
+        """
+        Compute FFT power spectrum of a real signal.
         
-        return power_spectrum
+        Uses scipy's real-input FFT (half the work of a full complex FFT) and mirrors
+        it, so the result keeps the full-length np.fft bin order that
+        extract_frequency_peaks and stored spectra expect. float32 signals give
+        float32 spectra (complex64 FFT), halving the memory traffic.
+        """
+        return _power_spectrum(np.asarray(signal_data))
     
-    def extract_frequency_peaks(self, spectrum: np.ndarray, sample_rate: float = 1000.0, num_peaks: int = 5) -> List[float]:
-        """Extract top N frequency peaks from spectrum."""
-        frequencies = np.fft.fftfreq(len(spectrum), 1/sample_rate)
-        
-        # Find peaks (simplified - in production would use scipy.signal.find_peaks)
-        peak_indices = np.argsort(spectrum)[-num_peaks:][::-1]
-        peak_frequencies = [abs(frequencies[i]) for i in peak_indices]
+    def compute_frequency_spectrum_batch(self, signals: np.ndarray, sample_rate: float = 1000.0) -> np.ndarray:
+        """
+        Compute power spectra for a stack of equal-length signals (one per row).
         
-        return sorted(peak_frequencies)
+        One FFT call over the last axis, spread across all cores; row i equals
+        compute_frequency_spectrum(signals[i]).
+        """
+        return _power_spectrum(np.asarray(signals), workers=-1)
+    
+    def extract_frequency_peaks(self, spectrum: np.ndarray, sample_rate: float = 1000.0, num_peaks: int = 5) -> np.ndarray:
+        """Extract top N frequency peaks from spectrum, as a sorted array."""
+        return _frequency_peaks(spectrum, sample_rate, num_peaks)
+    
+    @staticmethod
+    def _signal_peaks(spectrum: np.ndarray, fingerprint: SignalFingerprint) -> np.ndarray:
+        """Peaks of a signal's spectrum, reusing the fingerprint's when it is the baseline array itself."""
+        if spectrum is fingerprint.baseline_spectrum and fingerprint.baseline_peaks is not None:
+            return fingerprint.baseline_peaks
+        return _frequency_peaks(spectrum, 1000.0, 5)
+    
+    def _peaks_agree(self, digital_spectrum: np.ndarray, physical_spectrum: np.ndarray,
+                     fingerprint: SignalFingerprint) -> bool:
+        """Whether both spectra show the same subset of the fingerprint's expected peaks."""
+        digital_peaks = self._signal_peaks(digital_spectrum, fingerprint)
+        physical_peaks = self._signal_peaks(physical_spectrum, fingerprint)
+    
+        # Check if peaks match expected fingerprint: which expected peaks each side
+        # sees (within 1 Hz), in one broadcast per side
+        expected_peaks = fingerprint.expected_peaks
+        digital_match = (np.abs(digital_peaks[:, None] - expected_peaks[None, :]) < 1.0).any(axis=0)
+        physical_match = (np.abs(physical_peaks[:, None] - expected_peaks[None, :]) < 1.0).any(axis=0)
+        return bool(np.array_equal(digital_match, physical_match))
     
     def verify_digital_against_physical(
         self,
@@ -136,7 +229,7 @@ class PhysicsIngestEngine:
         Verify that a digital SCADA signal matches the physical reality.
         If they don't match, flag a potential hardware hack.
         """
-        start_time = datetime.now()
+        start_ns = time.perf_counter_ns()
         
         # Get fingerprint for this sensor
         fingerprint = self.signal_fingerprints.get(sensor_id)
@@ -148,7 +241,6 @@ class PhysicsIngestEngine:
                 signals_match=False,
                 confidence=0.0,
                 discrepancy_type='no_fingerprint',
-                timestamp=datetime.now(),
                 verification_time_ms=0.0
             )
         
@@ -157,19 +249,10 @@ class PhysicsIngestEngine:
         
         # Compare frequency spectra if available
         spectrum_match = True
-        if digital_signal.frequency_spectrum is not None and physical_signal.frequency_spectrum is not None:
-            # Compare frequency peaks
-            digital_peaks = self.extract_frequency_peaks(digital_signal.frequency_spectrum)
-            physical_peaks = self.extract_frequency_peaks(physical_signal.frequency_spectrum)
-            
-            # Check if peaks match expected fingerprint
-            for expected_peak in fingerprint.expected_frequency_peaks:
-                digital_match = any(abs(p - expected_peak) < 1.0 for p in digital_peaks)
-                physical_match = any(abs(p - expected_peak) < 1.0 for p in physical_peaks)
-                
-                if digital_match != physical_match:
-                    spectrum_match = False
-                    break
+        digital_spectrum = digital_signal.frequency_spectrum
+        physical_spectrum = physical_signal.frequency_spectrum
+        if digital_spectrum is not None and physical_spectrum is not None:
+            spectrum_match = self._peaks_agree(digital_spectrum, physical_spectrum, fingerprint)
         
         # Determine if signals match
         signals_match = value_match and spectrum_match
@@ -191,7 +274,7 @@ class PhysicsIngestEngine:
             # Lower confidence if there's a mismatch
             confidence = 0.3 if discrepancy_type == 'hardware_hack' else 0.6
         
-        verification_time = (datetime.now() - start_time).total_seconds() * 1000  # ms
+        verification_time = (time.perf_counter_ns() - start_ns) * 1e-6  # ms
         
         verification = SignalVerification(
             digital_signal_value=digital_signal.value,
@@ -199,13 +282,26 @@ class PhysicsIngestEngine:
             signals_match=signals_match,
             confidence=confidence,
             discrepancy_type=discrepancy_type,
-            timestamp=datetime.now(),
             verification_time_ms=verification_time
         )
         
-        self.verification_history.append(verification)
+        self._record(verification)
         return verification
     
+    def _record(self, verification: SignalVerification):
+        """Append to the bounded history, keeping the running totals in step (thread-safe)."""
+        with self._history_lock:
+            if len(self.verification_history) == self.verification_history.maxlen:
+                self._tally(self.verification_history[0], -1)
+            self.verification_history.append(verification)
+            self._tally(verification, 1)
+    
+    def _tally(self, verification: SignalVerification, sign: int):
+        """Add (sign=1) or remove (sign=-1) a verification from the running totals."""
+        self._match_count += sign * verification.signals_match
+        self._hack_count += sign * (verification.discrepancy_type == 'hardware_hack')
+        self._time_sum_ms += sign * verification.verification_time_ms
+    
     def detect_hardware_hack(
         self,
         sensor_id: str,
@@ -222,22 +318,14 @@ class PhysicsIngestEngine:
         hacks_detected = []
         confidences = []
         
-        # Verify against acoustic signal if available
-        if acoustic_signal:
+        # Verify against each physical signal that is available (acoustic, then RF).
+        # Sequential on purpose: each is a single small peak search, cheaper than a
+        # thread hand-off, and the history keeps its order.
+        for physical_signal in (acoustic_signal, rf_signal):
+            if not physical_signal:
+                continue
             verification = self.verify_digital_against_physical(
-                sensor_id, digital_signal, acoustic_signal
-            )
-            if verification.discrepancy_type == 'hardware_hack':
-                hacks_detected.append(True)
-                confidences.append(verification.confidence)
-            elif verification.signals_match:
-                hacks_detected.append(False)
-                confidences.append(verification.confidence)
-        
-        # Verify against RF signal if available
-        if rf_signal:
-            verification = self.verify_digital_against_physical(
-                sensor_id, digital_signal, rf_signal
+                sensor_id, digital_signal, physical_signal
             )
             if verification.discrepancy_type == 'hardware_hack':
                 hacks_detected.append(True)
@@ -259,8 +347,15 @@ class PhysicsIngestEngine:
             return True, 0.6, 'suspicious_activity'
     
     def get_verification_statistics(self) -> Dict:
-        """Get statistics on signal verifications."""
-        if not self.verification_history:
+        """Get statistics on the retained signal verifications."""
+        # One consistent snapshot of the history length and running totals
+        with self._history_lock:
+            total = len(self.verification_history)
+            matches = self._match_count
+            hacks = self._hack_count
+            time_sum_ms = self._time_sum_ms
+        
+        if total == 0:
             return {
                 'total_verifications': 0,
                 'matches': 0,
@@ -269,18 +364,13 @@ class PhysicsIngestEngine:
                 'average_verification_time_ms': 0.0
             }
         
-        matches = sum(1 for v in self.verification_history if v.signals_match)
-        mismatches = len(self.verification_history) - matches
-        hacks = sum(1 for v in self.verification_history if v.discrepancy_type == 'hardware_hack')
-        avg_time = np.mean([v.verification_time_ms for v in self.verification_history])
-        
         return {
-            'total_verifications': len(self.verification_history),
+            'total_verifications': total,
             'matches': matches,
-            'mismatches': mismatches,
+            'mismatches': total - matches,
             'hardware_hacks_detected': hacks,
-            'average_verification_time_ms': float(avg_time),
-            'match_rate': matches / len(self.verification_history) if self.verification_history else 0.0
+            'average_verification_time_ms': time_sum_ms / total,
+            'match_rate': matches / total
         }
 
 
@@ -7,8 +7,10 @@ from __future__ import annotations
 
 import sys
 import yaml
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import cpu_count
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, NamedTuple, Optional, Tuple
 
 # Add engine to path when run as script
 _engine = Path(__file__).resolve().parent
@@ -18,13 +20,17 @@ if str(_engine) not in sys.path:
 from compliance.regulatory_corpus import (
     get_regulations_for_scenario,
     list_scenario_types,
-    list_jurisdictions_for_scenario,
     REGULATORY_CORPUS,
 )
 from compliance.regulatory_mapper import get_regulatory_summary, list_jurisdictions
 
 from engine.logger import get_logger
 
+try:
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeDumper as _YamlDumper
+
 log = get_logger(__name__)
 
 
@@ -78,6 +84,31 @@ ACTION_TEMPLATES: Dict[str, List[Dict[str, Any]]] = {
     ],
 }
 
+
+class _ActionTemplate(NamedTuple):
+    """One template step with its defaults resolved."""
+    step: int
+    action: str
+    parameters: Dict[str, Any]
+    task_owner_key: str
+    approval_required: bool
+
+
+# ACTION_TEMPLATES resolved once at import (defaults applied, approval flag precomputed)
+_RESOLVED_TEMPLATES: Dict[str, Tuple[_ActionTemplate, ...]] = {
+    scenario_type: tuple(
+        _ActionTemplate(
+            step=t["step"],
+            action=t["action"],
+            parameters=t.get("parameters", {}),
+            task_owner_key=t.get("task_owner_key", "primary"),
+            approval_required=t.get("step", 0) in (2, 3),
+        )
+        for t in template
+    )
+    for scenario_type, template in ACTION_TEMPLATES.items()
+}
+
 # Human-readable titles and descriptions by scenario type
 SCENARIO_META: Dict[str, Dict[str, str]] = {
     "flood": {
@@ -138,27 +169,26 @@ def _build_actions(
     regulations: List[Dict[str, str]],
 ) -> List[Dict[str, Any]]:
     """Build actions list from template; task_owner from first/second/third authority."""
-    template = ACTION_TEMPLATES.get(scenario_type)
+    template = _RESOLVED_TEMPLATES.get(scenario_type)
     if not template:
-        template = ACTION_TEMPLATES.get("chaos_multi_fault", [])
+        template = _RESOLVED_TEMPLATES.get("chaos_multi_fault", ())
     authorities = [r.get("authority", "") for r in regulations if r.get("authority")]
     primary = authorities[0] if authorities else "Senior Operator"
     secondary = authorities[1] if len(authorities) > 1 else primary
     comms = "Communications Officer" if "Communications" not in str(authorities) else next((a for a in authorities if "Comms" in a or "Communications" in a), primary)
     key_to_owner = {"primary": primary, "secondary": secondary, "comms": comms, "regulatory": authorities[-1] if authorities else primary}
-    actions = []
-    for t in template:
-        task_owner = key_to_owner.get(t.get("task_owner_key", "primary"), primary)
-        actions.append({
-            "step": t["step"],
-            "action": t["action"],
+    return [
+        {
+            "step": t.step,
+            "action": t.action,
             "target_nodes": [],  # Caller or pipeline can bind to graph later
-            "parameters": t.get("parameters", {}),
-            "task_owner": task_owner,
-            "approval_required": t.get("step", 0) in (2, 3),
+            "parameters": t.parameters,
+            "task_owner": key_to_owner.get(t.task_owner_key, primary),
+            "approval_required": t.approval_required,
             "auto_assign": True,
-        })
-    return actions
+        }
+        for t in template
+    ]
 
 
 def design_playbook(
@@ -237,20 +267,21 @@ def design_all_playbooks_for_jurisdiction(
     If output_dir is set and write_yaml is True, writes each playbook to output_dir as <id>.yaml.
     """
     scenario_types = scenario_types or list_scenario_types()
+    jurisdiction_key = jurisdiction.upper()
     playbooks = []
     for st in scenario_types:
-        if st not in REGULATORY_CORPUS:
-            continue
-        jurs = list_jurisdictions_for_scenario(st)
-        if jurisdiction.upper() not in jurs:
+        # Direct dict membership rather than building the scenario's jurisdiction list
+        if jurisdiction_key not in REGULATORY_CORPUS.get(st, {}):
             continue
         pb = design_playbook(st, jurisdiction)
         playbooks.append(pb)
         if output_dir and write_yaml:
             output_dir.mkdir(parents=True, exist_ok=True)
             path = output_dir / f"{pb['id']}.yaml"
+            # Emit to a string and write it in one call
+            text = yaml.dump(pb, Dumper=_YamlDumper, default_flow_style=False, sort_keys=False, allow_unicode=True)
             with open(path, "w") as f:
-                yaml.safe_dump(pb, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
+                f.write(text)
     return playbooks
 
 
@@ -258,15 +289,29 @@ def design_all_playbooks(
     jurisdictions: Optional[List[str]] = None,
     output_dir: Optional[Path] = None,
     write_yaml: bool = True,
+    n_jobs: int = 1,
 ) -> List[Dict[str, Any]]:
     """
     Design playbooks for every scenario and every jurisdiction from the law codes.
     If output_dir is set, writes to output_dir/<jurisdiction>/<playbook_id>.yaml or output_dir/<playbook_id>.yaml.
+    
+    n_jobs > 1 designs (and writes) jurisdictions in worker processes; each writes
+    its own subdirectory, and playbooks are returned in jurisdiction order.
     """
     jurisdictions = jurisdictions or list_jurisdictions()
+    subdirs = [Path(output_dir) / jur if output_dir else None for jur in jurisdictions]
     all_playbooks = []
-    for jur in jurisdictions:
-        subdir = Path(output_dir) / jur if output_dir else None
+    n_workers = min(n_jobs, cpu_count() or 4, len(jurisdictions))
+    if n_workers > 1:
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            futures = [
+                executor.submit(design_all_playbooks_for_jurisdiction, jur, output_dir=subdir, write_yaml=write_yaml)
+                for jur, subdir in zip(jurisdictions, subdirs)
+            ]
+            for future in futures:
+                all_playbooks.extend(future.result())
+        return all_playbooks
+    for jur, subdir in zip(jurisdictions, subdirs):
         pbs = design_all_playbooks_for_jurisdiction(jur, output_dir=subdir, write_yaml=write_yaml)
         all_playbooks.extend(pbs)
     return all_playbooks
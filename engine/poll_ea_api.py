@@ -6,6 +6,7 @@ and triggers playbook when thresholds are exceeded.
 import time
 import json
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional
@@ -38,24 +39,49 @@ POLL_INTERVAL_SECONDS = 15 * 60  # 15 minutes
 API_BASE_URL = "http://localhost:3000/api"  # Next.js API
 DATA_DIR = Path(__file__).parent / "sample_data" / "carlisle"
 OUTPUT_DIR = Path(__file__).parent / "out" / "carlisle_polling"
+MEASURE_CACHE_PATH = OUTPUT_DIR / "_measure_cache.json"  # station_id -> level measure ID
 
 class ThresholdMonitor:
     """Monitors EA API and triggers playbooks when thresholds exceeded."""
     
-    def __init__(self, poll_interval: int = POLL_INTERVAL_SECONDS):
+    def __init__(self, poll_interval: int = POLL_INTERVAL_SECONDS, max_workers: int = 8):
         self.poll_interval = poll_interval
+        self.max_workers = max_workers  # Concurrent station checks per cycle (1 = serial)
         self.client = EAFloodClient()
         self.last_check = {}
         self.triggered_incidents = set()
+        # Level measure IDs are static per station: discover once, persist across restarts
+        self._measure_cache: Dict[str, str] = self._load_measure_cache()
+    
+    @staticmethod
+    def _load_measure_cache() -> Dict[str, str]:
+        """Load persisted station -> measure ID lookups (empty if missing or unreadable)."""
+        try:
+            with open(MEASURE_CACHE_PATH, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_measure_cache(self):
+        """Persist station -> measure ID lookups for the next run."""
+        try:
+            OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+            with open(MEASURE_CACHE_PATH, 'w') as f:
+                json.dump(self._measure_cache, f, indent=2)
+        except OSError as e:
+            log.warning(f"Could not save measure cache: {e}")
         
     def check_station(self, station_id: str, node_id: str, threshold: float) -> Optional[Dict]:
         """Check if station reading exceeds threshold."""
         try:
-            # Find level measure for station
-            measure_id = self.client.find_level_measure(station_id)
-            if not measure_id:
-                log.warning(f"No level measure found for station {station_id}")
-                return None
+            # Find level measure for station (cached after the first lookup)
+            measure_id = self._measure_cache.get(station_id)
+            if measure_id is None:
+                measure_id = self.client.find_level_measure(station_id)
+                if not measure_id:
+                    log.warning(f"No level measure found for station {station_id}")
+                    return None
+                self._measure_cache[station_id] = measure_id
             
             # Get latest reading
             latest = self.client.get_latest_reading(measure_id)
@@ -81,12 +107,18 @@ class ThresholdMonitor:
             
         except Exception as e:
             log.error(f"Error checking station {station_id}: {e}")
+            # Rediscover the measure next cycle in case it was retired
+            self._measure_cache.pop(station_id, None)
             return None
     
     def check_all_stations(self) -> List[Dict]:
-        """Check all configured stations for threshold breaches."""
-        alerts = []
+        """
+        Check all configured stations for threshold breaches.
         
+        Each check is network-bound, so stations are checked concurrently (up to
+        max_workers) over the client's pooled session; alerts keep station order.
+        """
+        checks = []
         for station_config in STATIONS:
             station_id = station_config['station_id']
             node_id = station_config['node_id']
@@ -95,11 +127,20 @@ class ThresholdMonitor:
             if threshold == 0:
                 continue  # No threshold configured
             
-            result = self.check_station(station_id, node_id, threshold)
-            if result and result['exceeded']:
-                alerts.append(result)
+            checks.append((station_id, node_id, threshold))
+        
+        cached_measures = dict(self._measure_cache)
+        n_workers = min(self.max_workers, len(checks))
+        if n_workers > 1:
+            with ThreadPoolExecutor(max_workers=n_workers) as executor:
+                results = list(executor.map(lambda check: self.check_station(*check), checks))
+        else:
+            results = [self.check_station(*check) for check in checks]
+        
+        if self._measure_cache != cached_measures:
+            self._save_measure_cache()
         
-        return alerts
+        return [result for result in results if result and result['exceeded']]
     
     def trigger_playbook(self, alert: Dict) -> bool:
         """Trigger playbook via API when threshold exceeded."""
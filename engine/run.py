@@ -77,7 +77,7 @@ def main(
         seed: Random seed for deterministic execution (default: 42)
         all_scenarios: If True, enumerate and simulate all conceivable + chaos scenarios; if False, run quick 3-incident set.
         max_scenarios: If set, cap at N scenarios (sample when over). Enables targeting e.g. 10,000.
-        n_jobs: Parallel workers for cascade simulation (1=sequential). Use 0 for auto (cpu_count-1).
+        n_jobs: Parallel workers for cascade simulation and packet generation (1=sequential). Use 0 for auto (cpu_count-1).
     """
     # Safety guard: Munin v1 is read-only
     assert_read_only()
@@ -264,7 +264,8 @@ def main(
         out_dir / "graph.json",
         out_dir / "evidence.json",
         playbooks_dir,
-        out_dir / "packets"
+        out_dir / "packets",
+        n_jobs=_n_jobs,
     )
     
     # Count generated packets
@@ -71,3 +71,13 @@ def test_graph_to_packets_pipeline(tmp_path):
     assert packet.get('playbookId')
     assert packet.get('status') == 'ready'
     assert 'timeToAuthorizeSeconds' in packet or 'timeToAuthorize' in packet
+
+    # HEAD holds the chain tip: the one receipt no other packet chains from
+    receipts = []
+    for packet_file in packet_files:
+        with open(packet_file) as f:
+            receipts.append(json.load(f)['merkle'])
+    chained_from = {r['previousHash'] for r in receipts}
+    tips = [r['receiptHash'] for r in receipts if r['receiptHash'] not in chained_from]
+    assert len(tips) == 1
+    assert (tmp_path / "packets" / "HEAD").read_text().strip() == tips[0]
@@ -0,0 +1,85 @@
+"""
+Logic-Lock command validation.
+Verify the per-asset-type specialised validators enforce the configured
+physics constraints (bounds plus safety margin), and that the YAML-driven
+rules engine keeps a bounded command history.
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add engine to path
+engine_dir = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(engine_dir))
+sys.path.insert(0, str(engine_dir.parent))
+
+from logic_lock import AssetType, LogicLockEngine, PhysicsViolationType
+import logic_lock_engine
+
+
+@pytest.fixture
+def engine():
+    return LogicLockEngine()
+
+
+def test_turbine_over_safe_rpm_is_blocked(engine):
+    """3600 rpm max with 15% margin: 3100 rpm must be blocked."""
+    validation = engine.validate_command("c1", "turbine_1", AssetType.TURBINE, {"rpm": 3100.0})
+    assert validation.blocked
+    assert validation.violations == [PhysicsViolationType.EXCEEDS_MAX_RPM]
+
+
+def test_turbine_within_limits_is_allowed(engine):
+    validation = engine.validate_command(
+        "c2", "turbine_1", AssetType.TURBINE, {"rpm": 3000.0, "temperature": 350.0}
+    )
+    assert validation.valid
+    assert validation.violations == []
+
+
+def test_violations_follow_constraint_order(engine):
+    """Violations are reported in constraint order so block reasons are stable."""
+    validation = engine.validate_command(
+        "c3", "turbine_1", AssetType.TURBINE, {"temperature": 600.0, "rpm": -1.0}
+    )
+    assert validation.violations == [
+        PhysicsViolationType.EXCEEDS_SAFETY_MARGIN,
+        PhysicsViolationType.EXCEEDS_MAX_TEMPERATURE,
+    ]
+    assert validation.reason.startswith("Command exceeds safety margin")
+
+
+def test_asset_type_without_constraints_is_allowed(engine):
+    validation = engine.validate_command("c4", "reactor_1", AssetType.REACTOR, {"rpm": 1e5 - 1})
+    assert validation.valid
+
+
+def test_recompiled_validators_pick_up_new_constraints(engine):
+    engine.constraints[AssetType.VALVE][0].max_value = 50.0
+    engine._compile_validators()
+    validation = engine.validate_command("c5", "valve_1", AssetType.VALVE, {"position": 60.0})
+    assert validation.violations == [PhysicsViolationType.EXCEEDS_SAFETY_MARGIN]
+
+
+def test_non_finite_bounds_compile_to_working_validators(engine):
+    """Unbounded (inf) and NaN bounds must not be emitted as bare names in the generated source."""
+    engine.constraints[AssetType.VALVE][0].min_value = float("-inf")
+    engine.constraints[AssetType.VALVE][0].max_value = float("inf")
+    engine.constraints[AssetType.PUMP][0].max_value = float("nan")
+    engine._compile_validators()
+    assert engine.validate_command("c6", "valve_1", AssetType.VALVE, {"position": 1e12}).valid
+    # Comparisons against NaN are false, so a NaN bound never fires (as with the literal bound)
+    assert engine.validate_command("c7", "pump_1", AssetType.PUMP, {"flow_rate": 1e12}).valid
+
+
+def test_rules_engine_history_is_bounded():
+    rules_engine = logic_lock_engine.LogicLockEngine()
+    for minute in range(10):
+        rules_engine.validate_command(logic_lock_engine.Command(
+            asset_id="pump_1", asset_type="pump", parameter="rpm", value=1000 + minute,
+            unit="rpm", timestamp=f"2026-01-01T00:{minute:02d}:00",
+        ))
+    history = rules_engine.command_history["pump_1"]
+    assert len(history) <= logic_lock_engine.LogicLockEngine.HISTORY_MAXLEN
+    assert history[-1].value == 1009
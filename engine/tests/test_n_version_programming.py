@@ -0,0 +1,64 @@
+"""
+N-version programming consensus.
+Verify running versions in worker processes matches sequential execution, that
+a crashed worker pool is replaced rather than failing every later decision, and
+that the engine releases its pool on close, and that the voter ignores the
+order of target nodes.
+"""
+import sys
+from pathlib import Path
+
+# Add engine to path
+engine_dir = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(engine_dir))
+sys.path.insert(0, str(engine_dir.parent))
+
+from n_version_programming import ConsensusResult, NVersionProgrammingEngine, VersionID
+
+INPUT = {'type': 'flood', 'impacted_nodes': ['pump_02', 'pump_01'], 'severity': 'high'}
+GRAPH = {'nodes': [], 'edges': []}
+EVIDENCE = {'windows': []}
+
+
+def _summary(decision):
+    return (
+        decision.consensus_result,
+        decision.agreed_command,
+        [(o.version_id, o.command, o.confidence) for o in decision.version_outputs],
+    )
+
+
+def test_parallel_versions_match_sequential():
+    sequential = NVersionProgrammingEngine().run_n_version_inference(INPUT, GRAPH, EVIDENCE)
+    with NVersionProgrammingEngine(n_jobs=3) as engine:
+        parallel = engine.run_n_version_inference(INPUT, GRAPH, EVIDENCE)
+    assert _summary(parallel) == _summary(sequential)
+    assert parallel.consensus_result == ConsensusResult.CONSENSUS
+    assert engine._pool is None
+
+
+def test_crashed_worker_pool_is_replaced():
+    with NVersionProgrammingEngine(n_jobs=3) as engine:
+        engine.run_n_version_inference(INPUT, GRAPH, EVIDENCE)
+        broken_pool = engine._pool
+        for process in list(broken_pool._processes.values()):
+            process.kill()
+            process.join()
+        
+        for _ in range(2):
+            decision = engine.run_n_version_inference(INPUT, GRAPH, EVIDENCE)
+            assert decision.consensus_result == ConsensusResult.CONSENSUS
+            assert len(decision.version_outputs) == 3
+        assert engine._pool is not broken_pool
+
+
+def test_target_node_order_is_not_a_disagreement():
+    engine = NVersionProgrammingEngine()
+    outputs = [
+        engine._run_version(version_id, INPUT, GRAPH, EVIDENCE)
+        for version_id in (VersionID.VERSION_A, VersionID.VERSION_B, VersionID.VERSION_C)
+    ]
+    outputs[1].command['target_nodes'] = ['pump_02', 'pump_01']
+    result, agreed, details = engine._determine_consensus(outputs)
+    assert result == ConsensusResult.CONSENSUS
+    assert details == []
@@ -0,0 +1,66 @@
+"""
+MetricsCollector aggregation and Prometheus export.
+"""
+import sys
+from pathlib import Path
+
+# Add engine to path
+engine_dir = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(engine_dir))
+
+from observability_metrics import MetricsCollector
+
+
+def test_counter_labels_are_order_independent():
+    metrics = MetricsCollector()
+    metrics.increment_counter("requests", {"b": "2", "a": "1"})
+    metrics.increment_counter("requests", {"a": "1", "b": "2"})
+    assert 'requests{a="1",b="2"} 2.0' in metrics.export_prometheus_format().splitlines()
+
+
+def test_type_line_emitted_once_per_metric_name():
+    metrics = MetricsCollector()
+    metrics.increment_counter("requests", {"route": "a"})
+    metrics.increment_counter("requests", {"route": "b"})
+    lines = metrics.export_prometheus_format().splitlines()
+    assert lines.count("# TYPE requests counter") == 1
+
+
+def test_histogram_buckets_are_cumulative():
+    metrics = MetricsCollector()
+    for value in (0.005, 0.2, 0.4, 30.0):
+        metrics.observe_histogram("latency", value)
+    lines = metrics.export_prometheus_format().splitlines()
+    assert 'latency_bucket{le="0.005"} 1' in lines
+    assert 'latency_bucket{le="0.25"} 2' in lines
+    assert 'latency_bucket{le="10.0"} 3' in lines
+    assert 'latency_bucket{le="+Inf"} 4' in lines
+    assert "latency_count 4" in lines
+
+
+def test_raw_history_is_opt_in_and_bounded():
+    assert MetricsCollector().metrics is None
+    metrics = MetricsCollector(history_size=2)
+    for i in range(5):
+        metrics.set_gauge("queue_depth", float(i))
+    assert [m.value for m in metrics.metrics] == [3.0, 4.0]
+
+
+def test_concurrent_increments_are_not_lost():
+    import threading
+
+    metrics = MetricsCollector()
+
+    def work():
+        for _ in range(2000):
+            metrics.increment_counter("hits", {"route": "a"})
+            metrics.observe_histogram("latency", 0.01)
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    lines = metrics.export_prometheus_format().splitlines()
+    assert 'hits{route="a"} 16000.0' in lines
+    assert "latency_count 16000" in lines
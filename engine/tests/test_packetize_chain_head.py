@@ -0,0 +1,101 @@
+"""
+Merkle chain tip tracking in packetize.
+Verify read_chain_head returns the HEAD file when present and otherwise falls
+back to the newest packet receipt in the directory, and that a run interrupted
+partway leaves HEAD at the last packet it wrote and audits every packet on disk.
+"""
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add engine to path
+engine_dir = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(engine_dir))
+
+import packetize
+from packetize import CHAIN_HEAD_FILENAME, _write_chain_head, packetize_incidents, read_chain_head
+
+PLAYBOOKS_DIR = engine_dir.parent / "playbooks"
+
+
+def _write_packet(directory, packet_id, created_ts, receipt_hash):
+    packet = {"id": packet_id, "createdTs": created_ts, "merkle": {"receiptHash": receipt_hash}}
+    (directory / f"{packet_id}.json").write_text(json.dumps(packet))
+
+
+def test_head_file_is_returned_without_scanning(tmp_path):
+    _write_packet(tmp_path, "packet_a", "2026-01-02T00:00:00", "from_packets")
+    _write_chain_head(tmp_path, "from_head")
+    assert read_chain_head(tmp_path) == "from_head"
+    assert not (tmp_path / f".{CHAIN_HEAD_FILENAME}.tmp").exists()
+
+
+def test_missing_head_falls_back_to_newest_packet(tmp_path):
+    _write_packet(tmp_path, "packet_a", "2026-01-01T00:00:00", "older")
+    _write_packet(tmp_path, "packet_b", "2026-01-03T00:00:00", "newest")
+    _write_packet(tmp_path, "packet_c", "2026-01-02T00:00:00", "middle")
+    (tmp_path / "not_a_packet.json").write_text("{not json")
+    assert read_chain_head(tmp_path) == "newest"
+
+
+def test_empty_head_falls_back_to_scan(tmp_path):
+    _write_packet(tmp_path, "packet_a", "2026-01-01T00:00:00", "only")
+    (tmp_path / CHAIN_HEAD_FILENAME).write_text("\n")
+    assert read_chain_head(tmp_path) == "only"
+
+
+def test_empty_directory_has_no_head(tmp_path):
+    assert read_chain_head(tmp_path) is None
+
+
+def _write_inputs(directory, prefix, n_incidents):
+    incidents = [
+        {"id": f"{prefix}_{i}", "type": "flood", "timeline": [{"timestep": 0, "impactedNodeIds": ["pump_1"]}]}
+        for i in range(n_incidents)
+    ]
+    (directory / "incidents.json").write_text(json.dumps({"incidents": incidents}))
+    (directory / "graph.json").write_text(json.dumps({"nodes": [{"id": "pump_1", "region": "north"}], "edges": []}))
+    (directory / "evidence.json").write_text(json.dumps({"windows": []}))
+
+
+def _packetize(directory):
+    packetize_incidents(
+        directory / "incidents.json", directory / "graph.json", directory / "evidence.json",
+        PLAYBOOKS_DIR, directory / "packets"
+    )
+
+
+def _receipts(packets_dir):
+    return {
+        packet["id"]: packet["merkle"]
+        for packet in (json.loads(path.read_text()) for path in packets_dir.glob("*.json"))
+    }
+
+
+def test_interrupted_run_leaves_head_and_audit_at_last_written_packet(tmp_path, monkeypatch):
+    # A completed earlier run leaves a HEAD the interrupted run has to move past
+    _write_inputs(tmp_path, "earlier", 1)
+    _packetize(tmp_path)
+    
+    _write_inputs(tmp_path, "later", 3)
+    write_packet_file = packetize._write_packet_file
+    written = []
+    
+    def fail_on_third(path, packet):
+        if len(written) == 2:
+            raise OSError("disk full")
+        write_packet_file(path, packet)
+        written.append(packet["id"])
+    
+    monkeypatch.setattr(packetize, "_write_packet_file", fail_on_third)
+    with pytest.raises(OSError):
+        _packetize(tmp_path)
+    
+    receipts = _receipts(tmp_path / "packets")
+    assert len(receipts) == 3
+    assert read_chain_head(tmp_path / "packets") == receipts[written[-1]]["receiptHash"]
+    
+    audit = [json.loads(line) for line in (tmp_path / "audit.jsonl").read_text().splitlines()]
+    assert sorted(entry["packet_id"] for entry in audit if entry["action"] == "create") == sorted(receipts)
@@ -0,0 +1,75 @@
+"""
+Evidence selection in packetize.generate_packet.
+Verify evidence windows are matched to impacted nodes by exact node id
+(via the window's edge endpoints), not by substring, and that generated
+packets satisfy the packet schema without the runtime re-check.
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add engine to path
+engine_dir = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(engine_dir))
+
+from packetize import _validate_packet_structure, generate_packet
+
+
+def _graph():
+    return {
+        "nodes": [
+            {"id": "pump_1", "region": "north"},
+            {"id": "pump_10", "region": "south"},
+            {"id": "reservoir_1", "region": "north"},
+        ],
+        "edges": [
+            {"id": "e1", "source": "pump_1", "target": "reservoir_1"},
+            {"id": "e10", "source": "pump_10", "target": "reservoir_1"},
+        ],
+    }
+
+
+def _incident(impacted):
+    return {
+        "id": "inc_1",
+        "type": "flood",
+        "timeline": [{"timestep": 0, "impactedNodeIds": impacted}],
+    }
+
+
+def test_evidence_matched_by_exact_node_id():
+    """pump_1 must not pick up evidence for an edge touching only pump_10/reservoir_1."""
+    evidence = {
+        "windows": [
+            {"id": "ev-1", "edgeId": "e1", "robustness": 0.9},
+            {"id": "ev-10", "edgeId": "e10", "robustness": 0.1},
+        ]
+    }
+    packet = generate_packet(_incident(["pump_1"]), "flood.yaml", _graph(), evidence)
+    assert packet["evidenceRefs"] == ["ev-1"]
+    assert packet["uncertainty"]["overall"] == pytest.approx(0.1)
+
+
+def test_legacy_source_target_evidence_is_matched():
+    evidence = {
+        "windows": [
+            {"id": "ev-legacy", "sourceNodeId": "pump_10", "targetNodeId": "reservoir_1", "robustness": 0.8},
+        ]
+    }
+    packet = generate_packet(_incident(["pump_10"]), "flood.yaml", _graph(), evidence)
+    assert packet["evidenceRefs"] == ["ev-legacy"]
+
+
+def test_no_matching_evidence_uses_default_uncertainty():
+    evidence = {"windows": [{"id": "ev-1", "edgeId": "e1", "robustness": 0.9}]}
+    packet = generate_packet(_incident(["pump_10"]), "flood.yaml", _graph(), evidence)
+    assert packet["evidenceRefs"] == []
+    assert packet["uncertainty"]["overall"] == pytest.approx(0.3)
+
+
+def test_generated_packet_matches_schema():
+    evidence = {"windows": [{"id": "ev-1", "edgeId": "e1", "robustness": 0.9}]}
+    packet = generate_packet(_incident(["pump_1", "pump_10"]), "flood.yaml", _graph(), evidence)
+    _validate_packet_structure(packet)
+    assert packet["scope"]["nodeIds"] == ["pump_1", "pump_10"]
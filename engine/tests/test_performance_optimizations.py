@@ -0,0 +1,121 @@
+"""
+Performance optimizations for graph inference.
+Verify sensor health reports the real missing ratio, parallel correlation
+matches the serial batch, projections are deterministic, downsampling error
+bounds match a per-column reference, and the correlation cache evicts the
+least recently used pair.
+"""
+import sys
+from collections import OrderedDict
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add engine to path
+engine_dir = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(engine_dir))
+
+import performance_optimizations as po
+
+
+def _minute_frame(n_rows, columns):
+    index = pd.date_range("2026-01-01", periods=n_rows, freq="1min")
+    return pd.DataFrame(columns, index=index)
+
+
+def test_sensor_health_reports_real_missing_ratio():
+    alternating = np.tile([9.0, 11.0], 10)
+    df = _minute_frame(25, {
+        "gappy": np.concatenate([[np.nan] * 5, alternating]),
+        "drifting": np.concatenate([[np.nan] * 5, alternating[:10], alternating[:10] + 10.0]),
+        "sparse": np.concatenate([np.arange(9.0), [np.nan] * 16]),
+    })
+    health = po.vectorized_sensor_health(df)
+    
+    # 5 of 25 rows missing; noise is capped at 1 and there is no drift
+    assert health["gappy"]["missing_ratio"] == pytest.approx(0.2)
+    assert health["gappy"]["score"] == pytest.approx(0.8 * 0.4 + 0.3)
+    assert health["gappy"]["status"] == "degraded"
+    assert not health["gappy"]["drift_detected"]
+    
+    # Halves are split over observed values, so the level shift is drift
+    assert health["drifting"]["drift_detected"]
+    assert health["drifting"]["score"] == pytest.approx(0.8 * 0.4 + 0.3 + 0.5 * 0.2)
+    assert health["drifting"]["status"] == "ok"
+    
+    assert health["sparse"] == {"status": "insufficient_data", "score": 0.0}
+
+
+def test_parallel_correlation_matches_serial_batch():
+    rng = np.random.RandomState(0)
+    base = rng.randn(120).cumsum()
+    df = _minute_frame(120, {
+        "a": base,
+        "b": np.roll(base, 2) + rng.randn(120) * 0.1,
+        "c": rng.randn(120),
+    })
+    pairs = [("a", "b"), ("a", "c"), ("b", "c")]
+    
+    parallel = po.parallelize_correlation_computation(df, pairs, max_lag_seconds=300, min_samples=10, n_jobs=2)
+    serial = po.compute_correlation_batch([(s, t, df[s], df[t]) for s, t in pairs], 300, 10)
+    assert parallel == {(s, t): (corr, lag) for s, t, corr, lag in serial}
+
+
+def test_approximate_correlation_uses_fixed_read_only_projection():
+    rng = np.random.RandomState(1)
+    s1, s2 = pd.Series(rng.randn(50)), pd.Series(rng.randn(50))
+    
+    projection = np.random.RandomState(42).randn(10, 50)
+    expected = np.corrcoef(projection @ s1.values, projection @ s2.values)[0, 1]
+    assert po.fast_approximate_correlation(s1, s2) == pytest.approx(expected)
+    assert po.fast_approximate_correlation(s1, s2) == po.fast_approximate_correlation(s1, s2)
+    assert not po._projection_matrix(10, 50).flags.writeable
+
+
+def test_downsample_error_bounds_match_per_column_reference():
+    rng = np.random.RandomState(2)
+    gappy = rng.randn(30)
+    gappy[[3, 4, 17]] = np.nan
+    df = _minute_frame(30, {"dense": rng.randn(30), "gappy": gappy, "empty": [np.nan] * 30})
+    
+    downsampled, bounds = po.downsample_timeseries(df, "5min")
+    expected = {}
+    for col in df.columns:
+        original, resampled = df[col].dropna(), downsampled[col].dropna()
+        if len(original) and len(resampled):
+            aligned = original.reindex(resampled.index, method="nearest")
+            expected[col] = float((aligned - resampled).abs().max())
+    
+    assert list(bounds) == ["dense", "gappy"]
+    assert bounds == pytest.approx(expected)
+
+
+def test_correlation_cache_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setattr(po, "CORRELATION_CACHE_SIZE", 2)
+    monkeypatch.setattr(po, "_CORRELATION_CACHE", OrderedDict())
+    computed = []
+    
+    def compute(series1, series2, max_lag_seconds, min_samples):
+        computed.append((series1.name, series2.name))
+        return float(len(computed)), 0
+    
+    monkeypatch.setattr(po, "compute_and_cache_correlation", compute)
+    df = _minute_frame(20, {name: np.arange(20.0) * (i + 1) for i, name in enumerate("abc")})
+    
+    def correlate(source, target):
+        return po.cached_correlation(df[source], df[target], 300, 10)
+    
+    assert correlate("a", "b") == (1.0, 0)
+    assert correlate("a", "c") == (2.0, 0)
+    assert correlate("a", "b") == (1.0, 0)  # hit; (a, c) is now least recent
+    assert correlate("b", "c") == (3.0, 0)  # evicts (a, c)
+    assert correlate("a", "b") == (1.0, 0)
+    assert correlate("a", "c") == (4.0, 0)
+    assert computed == [("a", "b"), ("a", "c"), ("b", "c"), ("a", "c")]
+    
+    # Keyed on content: same values at other timestamps are a different pair
+    shifted = df.set_axis(df.index + pd.Timedelta(minutes=1))
+    po.cached_correlation(shifted["a"], shifted["b"], 300, 10)
+    assert len(computed) == 5
@@ -0,0 +1,68 @@
+"""
+Unified physical truth verification.
+Verify matching readings verify, that a vibration baseline does not compare its
+amplitude against the SCADA value, and that a physical pressure measurement is
+compared directly with the digital pressure.
+"""
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add engine to path
+engine_dir = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(engine_dir))
+sys.path.insert(0, str(engine_dir.parent))
+
+from physical_truth import UnifiedPhysicalTruthEngine
+from physics_ingest import SignalFingerprint, SignalType
+
+
+def _engine(signal_type):
+    engine = UnifiedPhysicalTruthEngine()
+    baseline = SignalFingerprint(
+        signal_type=signal_type,
+        sensor_id="pump_01",
+        expected_frequency_peaks=[25.0, 50.0],
+        expected_amplitude_range=(0.5, 1.0),
+        expected_phase_characteristics={},
+        baseline_spectrum=np.zeros(16),
+    )
+    engine.register_unified_fingerprint("pump_01", "pump", physics_ingest_fingerprint=baseline)
+    return engine
+
+
+def test_matching_rpm_and_vibration_verify():
+    engine = _engine(SignalType.ACOUSTIC_VIBRATION)
+    result = engine.verify_digital_vs_physical(
+        "pump_01",
+        {"parameter": "rpm", "value": 1500.0, "unit": "rpm"},
+        {"signal_type": "ACOUSTIC", "frequency_hz": 25.0, "amplitude": 0.8, "harmonics": [25.0, 50.0], "noise_level": 0.1},
+    )
+    assert result["verified"] is True
+    assert result["discrepancy_type"] is None
+    # The vibration amplitude is never compared with the rpm value
+    assert engine.physics_ingest.get_verification_statistics()["total_verifications"] == 0
+
+
+def test_mismatched_frequency_is_not_verified():
+    engine = _engine(SignalType.ACOUSTIC_VIBRATION)
+    result = engine.verify_digital_vs_physical(
+        "pump_01",
+        {"parameter": "rpm", "value": 1500.0, "unit": "rpm"},
+        {"signal_type": "ACOUSTIC", "frequency_hz": 40.0, "amplitude": 0.8, "noise_level": 0.1},
+    )
+    assert result["verified"] is False
+    assert result["discrepancy_type"] == "mismatch"
+
+
+def test_physical_pressure_is_compared_with_digital_pressure():
+    engine = _engine(SignalType.PRESSURE_PHYSICAL)
+    digital = {"parameter": "pressure", "value": 5.0, "unit": "bar"}
+    
+    matching = engine.verify_digital_vs_physical("pump_01", digital, {"signal_type": "pressure", "value": 5.02})
+    assert matching["verified"] is True
+    
+    drifted = engine.verify_digital_vs_physical("pump_01", digital, {"signal_type": "pressure", "value": 7.0})
+    assert drifted["verified"] is False
+    assert drifted["discrepancy_type"] == "sensor_failure"
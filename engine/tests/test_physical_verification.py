@@ -0,0 +1,102 @@
+"""
+Physical verification of digital readings.
+Verify the batched entrypoint agrees with per-record verification, that the
+summary tracks the bounded history, that harmonics are sorted once when a
+signal is built, and that the dominant frequency is recovered from raw samples.
+"""
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add engine to path
+engine_dir = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(engine_dir))
+sys.path.insert(0, str(engine_dir.parent))
+
+from physical_verification import (
+    ASSET_TYPES,
+    RESULT_CODES,
+    UNKNOWN_ASSET_CODE,
+    DigitalReading,
+    PhysicalSignal,
+    PhysicalSignalType,
+    PhysicalVerificationEngine,
+    VerificationResult,
+)
+
+ROWS = [
+    # asset_type, parameter, value, frequency_hz, harmonics, noise, amplitude
+    ("pump", "rpm", 1500.0, 25.0, [25.0, 50.0], 0.1, 0.8),  # verified
+    ("pump", "rpm", 1500.0, 60.0, [60.0, 120.0], 0.1, 0.8),  # mismatch
+    ("turbine", "rpm", 3000.0, 50.0, [50.0, 170.0], 0.1, 0.8),  # missing 2nd harmonic
+    ("generator", "frequency", 50.0, 50.5, [], 0.6, 0.8),  # noisy sensor
+    ("valve", "pressure", 3.0, 10.0, [], 0.1, 0.8),  # no frequency mapping
+]
+
+
+def test_verify_batch_matches_single_record_verification():
+    engine = PhysicalVerificationEngine()
+    columns = list(zip(*ROWS))
+    codes, confidence, discrepancy = engine.verify_batch(
+        np.array(columns[0]), np.array(columns[1]), np.array(columns[2]), np.array(columns[3]),
+        noise=np.array(columns[5]), amp=np.array(columns[6]), phys_harmonics=list(columns[4]),
+    )
+    assert len(engine.verification_history) == 0
+
+    for i, (asset_type, parameter, value, freq, harmonics, noise, amp) in enumerate(ROWS):
+        single = engine.verify_digital_reading(
+            f"asset_{i}", asset_type,
+            DigitalReading("t", parameter, value, "u", "scada", "s"),
+            PhysicalSignal(PhysicalSignalType.ACOUSTIC, "t", freq, amp, harmonics, noise, "p", "l"),
+        )
+        assert RESULT_CODES[codes[i]] == single.verification_result
+        assert confidence[i] == pytest.approx(single.confidence)
+        if single.discrepancy is None:
+            assert np.isnan(discrepancy[i])
+        else:
+            assert discrepancy[i] == pytest.approx(single.discrepancy)
+
+
+def test_verify_batch_accepts_integer_asset_codes():
+    engine = PhysicalVerificationEngine()
+    names, parameters, values, freqs, _, noise, amp = zip(*ROWS)
+    codes = [ASSET_TYPES.index(t) if t in ASSET_TYPES else UNKNOWN_ASSET_CODE for t in names]
+    by_name = engine.verify_batch(names, parameters, values, freqs, noise, amp)
+    by_code = engine.verify_batch(codes, parameters, values, freqs, noise, amp)
+    for a, b in zip(by_name, by_code):
+        np.testing.assert_array_equal(a, b)
+
+
+def test_summary_counts_follow_bounded_history(monkeypatch):
+    monkeypatch.setattr(PhysicalVerificationEngine, "HISTORY_MAXLEN", 3)
+    engine = PhysicalVerificationEngine()
+    for freq in (60.0, 60.0, 25.0, 25.0, 25.0):  # two mismatches, then three verified
+        engine.verify_digital_reading(
+            "pump_alpha", "pump",
+            DigitalReading("t", "rpm", 1500.0, "rpm", "scada", "s"),
+            PhysicalSignal(PhysicalSignalType.ACOUSTIC, "t", freq, 0.8, [], 0.1, "p", "l"),
+        )
+    summary = engine.get_verification_summary()
+    assert summary["total_verifications"] == 3
+    assert summary["verified"] == 3
+    assert summary["mismatches"] == 0
+
+
+def test_harmonics_are_sorted_once_at_ingestion():
+    signal = PhysicalSignal(PhysicalSignalType.ACOUSTIC, "t", 25.0, 0.8, [75.0, 50.0, 25.0], 0.1, "p", "l")
+    assert signal.harmonics == [75.0, 50.0, 25.0]
+    np.testing.assert_array_equal(signal.sorted_harmonics, [25.0, 50.0, 75.0])
+
+    result = PhysicalVerificationEngine().verify_digital_reading(
+        "pump_alpha", "pump", DigitalReading("t", "rpm", 1500.0, "rpm", "scada", "s"), signal
+    )
+    assert result.verification_result == VerificationResult.VERIFIED
+
+
+def test_dominant_frequency_is_sub_bin_accurate():
+    sample_rate = 1000.0
+    t = np.arange(1000) / sample_rate
+    samples = 2.0 + np.sin(2 * np.pi * 25.3 * t) + 0.3 * np.sin(2 * np.pi * 50.6 * t)
+    assert PhysicalVerificationEngine.dominant_frequency(samples, sample_rate) == pytest.approx(25.3, abs=0.01)
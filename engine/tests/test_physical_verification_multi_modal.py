@@ -0,0 +1,127 @@
+"""
+Multi-modal physical verification.
+Verify the structure-of-arrays batch path agrees with per-sensor verification,
+including re-enrolled sensors, partially enrolled modalities and unknown sensors,
+that the batch rules agree with the scalar per-sensor rules value for value
+(edge cases and NaN included), and that per-sensor verification follows the
+fingerprint's current modalities.
+"""
+import itertools
+import math
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add engine to path
+engine_dir = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(engine_dir))
+
+from physical_verification_multi_modal import (
+    MODALITY_DATA,
+    MODALITY_DIFFS,
+    MultiModalFingerprint,
+    MultiModalPhysicalVerification,
+    SignalModality,
+)
+
+
+@pytest.fixture
+def engine():
+    engine = MultiModalPhysicalVerification()
+    engine.enroll_fingerprint("pump_1", "pump", {
+        SignalModality.ACOUSTIC: {"frequency_hz": 60.0, "amplitude": 0.8},
+        SignalModality.THERMAL: {"temperature_c": 45.0},
+    })
+    engine.enroll_fingerprint("pump_2", "pump", {SignalModality.RF: {"power_dbm": -40.0}})
+    engine.enroll_fingerprint("pump_3", "pump", {SignalModality.VIBRATION: {"frequency_hz": 30.0, "amplitude": 1.0}})
+    # Re-enrollment replaces the stored row
+    engine.enroll_fingerprint("pump_2", "pump", {
+        SignalModality.RF: {"power_dbm": -42.0},
+        SignalModality.MAGNETIC: {"field_ut": 3.0},
+    })
+    return engine
+
+
+def test_verify_batch_matches_per_sensor_verification(engine):
+    sensor_ids = ["pump_1", "pump_2", "pump_3", "unknown"]
+    current = {
+        SignalModality.ACOUSTIC: {"frequency_hz": np.array([59.0, 0.0, 0.0, 0.0]), "amplitude": np.array([0.8, 0.0, 0.0, 0.0])},
+        SignalModality.THERMAL: {"temperature_c": np.array([70.0, 0.0, 0.0, 0.0])},
+        SignalModality.RF: {"power_dbm": np.array([0.0, -41.0, 0.0, 0.0])},
+    }
+    confidence, verified = engine.verify_batch(sensor_ids, current, tolerance=0.1)
+
+    for i, sensor_id in enumerate(sensor_ids):
+        single = engine.verify_multi_modal(
+            sensor_id,
+            {modality: {k: float(v[i]) for k, v in fields.items()} for modality, fields in current.items()},
+            tolerance=0.1,
+        )
+        assert confidence[i] == pytest.approx(single["confidence"])
+        assert bool(verified[i]) == single["verified"]
+
+
+def test_every_compared_modality_has_rules_for_its_fields():
+    assert MODALITY_DIFFS.keys() == MODALITY_DATA.keys()
+    for modality, data_type in MODALITY_DATA.items():
+        assert type(MODALITY_DIFFS[modality]) is data_type
+
+
+@pytest.mark.parametrize("modality", list(MODALITY_DATA))
+def test_batch_rules_match_scalar_rules(modality):
+    # The batch path (NumPy) and the per-sensor path (plain Python) implement the
+    # rules separately; every enrolled/current pairing of these values must agree
+    values = [0.0, -5.0, 1e-12, 3, 60.0, 61.0, float("nan"), float("inf")]
+    fields = MODALITY_DATA[modality]._fields
+    cases = list(itertools.product(itertools.product(values, repeat=2), repeat=len(fields)))
+    
+    engine = MultiModalPhysicalVerification()
+    sensor_ids = [f"s{i}" for i in range(len(cases))]
+    for sensor_id, case in zip(sensor_ids, cases):
+        engine.enroll_fingerprint(sensor_id, "pump", {modality: {f: pair[0] for f, pair in zip(fields, case)}})
+    current = {f: np.array([case[k][1] for case in cases], dtype=np.float64) for k, f in enumerate(fields)}
+    
+    confidence, verified = engine.verify_batch(sensor_ids, {modality: current})
+    for i, (sensor_id, case) in enumerate(zip(sensor_ids, cases)):
+        result = engine.verify_multi_modal(sensor_id, {modality: {f: pair[1] for f, pair in zip(fields, case)}})
+        assert confidence[i] == result["confidence"] or (math.isnan(confidence[i]) and math.isnan(result["confidence"])), case
+        assert verified[i] == result["verified"], case
+
+
+def test_fingerprint_inserted_directly_is_verified(engine):
+    engine.fingerprints["manual"] = MultiModalFingerprint(
+        sensor_id="manual",
+        asset_type="pump",
+        modalities={SignalModality.RF: {"power_dbm": -40.0}},
+        created_at=datetime.now().isoformat(),
+        last_updated=datetime.now().isoformat(),
+        enrollment_metadata={},
+    )
+    result = engine.verify_multi_modal("manual", {SignalModality.RF: {"power_dbm": -40.0}})
+    assert result["verified"] and result["confidence"] == pytest.approx(1.0)
+    
+    # Plain-dict modalities are read on every call, so edits take effect
+    engine.fingerprints["manual"].modalities[SignalModality.RF]["power_dbm"] = -80.0
+    assert not engine.verify_multi_modal("manual", {SignalModality.RF: {"power_dbm": -40.0}})["verified"]
+
+
+def test_modalities_stay_editable_and_enrolled_snapshot_is_read_only(engine):
+    modality_data = {SignalModality.THERMAL: {"temperature_c": 45.0}}
+    fingerprint = engine.enroll_fingerprint("pump_9", "pump", modality_data)
+    assert fingerprint.modalities is modality_data
+    enrolled = engine.get_enrolled_modalities("pump_9")
+    with pytest.raises(TypeError):
+        enrolled[SignalModality.THERMAL]["temperature_c"] = 90.0
+    
+    # In-place edits are honoured rather than served from the cached records
+    fingerprint.modalities[SignalModality.THERMAL]["temperature_c"] = 90.0
+    assert not engine.verify_multi_modal("pump_9", {SignalModality.THERMAL: {"temperature_c": 45.0}})["verified"]
+    assert enrolled[SignalModality.THERMAL]["temperature_c"] == 45.0
+    
+    # So is replacing the mapping
+    fingerprint.modalities = {SignalModality.THERMAL: {"temperature_c": 45.0}}
+    assert engine.verify_multi_modal("pump_9", {SignalModality.THERMAL: {"temperature_c": 45.0}})["verified"]
+    assert engine.get_enrolled_modalities("unknown") is None
@@ -0,0 +1,79 @@
+"""
+Physics ingest spectrum handling.
+Verify power spectra keep the full np.fft layout, that peak extraction reports
+distinct spectral peaks rather than adjacent bins of one peak, that a
+spectrum disagreeing with the fingerprint is flagged as a hardware hack, and
+that the running statistics stay consistent under concurrent verification.
+"""
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add engine to path
+engine_dir = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(engine_dir))
+sys.path.insert(0, str(engine_dir.parent))
+
+from physics_ingest import PhysicalSignal, PhysicsIngestEngine, SignalType
+
+SAMPLE_RATE = 1000.0
+T = np.arange(1000) / SAMPLE_RATE
+
+
+def _tones(*frequencies):
+    return sum(np.sin(2 * np.pi * f * T) / (i + 1) for i, f in enumerate(frequencies))
+
+
+def test_spectrum_matches_numpy_full_fft():
+    signal = _tones(60.0, 120.0)[:999]  # odd length
+    spectrum = PhysicsIngestEngine().compute_frequency_spectrum(signal)
+    np.testing.assert_allclose(spectrum, np.abs(np.fft.fft(signal)) ** 2, atol=1e-9)
+
+
+def test_peaks_are_distinct_harmonics():
+    engine = PhysicsIngestEngine()
+    spectrum = engine.compute_frequency_spectrum(_tones(60.0, 120.0, 180.0))
+    np.testing.assert_allclose(engine.extract_frequency_peaks(spectrum), [60.0, 120.0, 180.0])
+    np.testing.assert_allclose(engine.extract_frequency_peaks(spectrum, num_peaks=2), [60.0, 120.0])
+
+
+def test_spectrum_disagreement_is_flagged_as_hardware_hack():
+    engine = PhysicsIngestEngine()
+    baseline = engine.compute_frequency_spectrum(_tones(60.0, 120.0))
+    engine.register_sensor_fingerprint("pump_04", SignalType.ACOUSTIC_VIBRATION, baseline, [60.0, 120.0], (0.8, 1.2))
+
+    digital = PhysicalSignal(SignalType.SCADA_DIGITAL, None, 1.0, baseline, "pump_04")
+    physical = PhysicalSignal(
+        SignalType.ACOUSTIC_VIBRATION, None, 1.0, engine.compute_frequency_spectrum(_tones(45.0)), "pump_04"
+    )
+    verification = engine.verify_digital_against_physical("pump_04", digital, physical)
+    assert not verification.signals_match
+    assert verification.discrepancy_type == "hardware_hack"
+    assert engine.get_verification_statistics()["hardware_hacks_detected"] == 1
+
+
+def test_statistics_stay_consistent_under_concurrent_verification(monkeypatch):
+    monkeypatch.setattr(PhysicsIngestEngine, "HISTORY_MAXLEN", 50)
+    engine = PhysicsIngestEngine()
+    baseline = engine.compute_frequency_spectrum(_tones(60.0, 120.0))
+    engine.register_sensor_fingerprint("pump_04", SignalType.ACOUSTIC_VIBRATION, baseline, [60.0, 120.0], (0.8, 1.2))
+    digital = PhysicalSignal(SignalType.SCADA_DIGITAL, None, 1.0, None, "pump_04")
+    
+    def verify(i):
+        # Alternate matching and mismatching values so both counters move
+        physical = PhysicalSignal(SignalType.ACOUSTIC_VIBRATION, None, 1.0 + (i % 2), None, "pump_04")
+        engine.verify_digital_against_physical("pump_04", digital, physical)
+    
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(verify, range(2000)))
+    
+    stats = engine.get_verification_statistics()
+    history = list(engine.verification_history)
+    assert stats["total_verifications"] == len(history) == 50
+    assert stats["matches"] == sum(v.signals_match for v in history)
+    assert stats["average_verification_time_ms"] == pytest.approx(
+        sum(v.verification_time_ms for v in history) / len(history)
+    )